@@ -3,25 +3,57 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from engine.board import Board
 from engine.constants import START_FEN
-from engine.instrumentation import SearchSnapshot
+from engine.instrumentation import SearchSnapshot, SnapshotDiffer
 from engine.search import SearchEngine, SearchResult
 
 router = APIRouter()
 
+# Frame encoding runs off both the search thread and the event loop. The pool
+# is shared by all connections so one slow encode cannot hold up the others;
+# order within a connection holds because each awaits its frame before
+# encoding the next.
+_SERIALIZER = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ws-serializer")
 
-def _serialize_snapshot(snapshot: SearchSnapshot) -> dict:
-    payload = snapshot.to_dict()
-    payload["type"] = "snapshot"
-    return payload
 
+def _encode(payload: dict) -> str:
+    # orjson is several times faster than the stdlib encoder behind send_json;
+    # messages stay text frames because the client JSON.parses event.data.
+    return orjson.dumps(payload).decode()
 
-def _serialize_complete(result: SearchResult) -> dict:
-    return {
+
+def _merge_batch(batch: list[SearchSnapshot | str], differ: SnapshotDiffer) -> str:
+    """Encode drained messages as one frame, keeping the newest snapshot per depth.
+
+    Snapshots arrive raw and are only encoded if they survive coalescing, as
+    deltas against the previously sent snapshot; other messages are
+    already-encoded strings and are always kept. A multi-message frame is the
+    JSON array of the encoded messages.
+    """
+    latest_by_depth: dict[int, int] = {}
+    for idx, item in enumerate(batch):
+        if isinstance(item, SearchSnapshot):
+            latest_by_depth[item.depth] = idx
+
+    kept = [
+        differ.encode(item) if isinstance(item, SearchSnapshot) else item
+        for idx, item in enumerate(batch)
+        if not isinstance(item, SearchSnapshot) or latest_by_depth[item.depth] == idx
+    ]
+    if len(kept) == 1:
+        return kept[0]
+    return "[" + ",".join(kept) + "]"
+
+
+def _serialize_complete(result: SearchResult) -> str:
+    payload = {
         "type": "complete",
         "depth": result.depth,
         "nodes": result.nodes,
@@ -38,11 +70,61 @@ def _serialize_complete(result: SearchResult) -> dict:
         "elapsed_ms": round(result.elapsed_ms, 2),
         "best_move": result.best_move.uci() if result.best_move else None,
     }
+    return _encode(payload)
+
+
+class _SnapshotChannel:
+    """Hand-off from one search to the connection's writer coroutine.
+
+    Single producer (search thread, via the event loop) and single consumer:
+    a deque plus one wake-up future avoids asyncio.Queue's per-item getter
+    bookkeeping and lets the consumer drain everything pending. With
+    ``max_queue > 0`` only the newest snapshots are kept. The final message
+    is held apart so the bound never evicts it.
+    """
+
+    def __init__(self, max_queue: int = 0) -> None:
+        self._pending: deque[SearchSnapshot] = deque(maxlen=max_queue or None)
+        self._final: str | None = None
+        self._done = False
+        self._ready: asyncio.Future[None] | None = None
+
+    def push(self, snapshot: SearchSnapshot) -> None:
+        self._pending.append(snapshot)
+        self._wake()
+
+    def finish(self, message: str | None) -> None:
+        self._final = message
+        self._done = True
+        self._wake()
+
+    async def wait(self) -> None:
+        if self._pending or self._done:
+            return
+        self._ready = asyncio.get_running_loop().create_future()
+        await self._ready
+        self._ready = None
+
+    def drain(self) -> tuple[list[SearchSnapshot | str], bool]:
+        """Return everything pending and whether the search has finished."""
+        batch: list[SearchSnapshot | str] = list(self._pending)
+        self._pending.clear()
+        if self._done and self._final is not None:
+            batch.append(self._final)
+        return batch, self._done
+
+    def _wake(self) -> None:
+        if self._ready is not None and not self._ready.done():
+            self._ready.set_result(None)
 
 
 @router.websocket("/ws/search")
 async def search_websocket(websocket: WebSocket) -> None:
     await websocket.accept()
+    # Messages on one connection are searched strictly one after another, so a
+    # single engine per connection is safe and keeps its state warm between
+    # requests; search() resets the per-search counters itself.
+    engine = SearchEngine()
 
     try:
         while True:
@@ -52,15 +134,27 @@ async def search_websocket(websocket: WebSocket) -> None:
             time_limit_ms = int(payload.get("time_limit_ms", 3000))
             snapshot_interval_ms = int(payload.get("snapshot_interval_ms", 75))
 
+            # 0 keeps every pending snapshot; a positive bound drops the oldest
+            # ones when the client reads slower than the search produces.
+            snapshot_max_queue = int(payload.get("snapshot_max_queue", 0))
+            if snapshot_max_queue < 0:
+                await websocket.send_text(
+                    _encode({"type": "error", "message": "snapshot_max_queue must be >= 0"})
+                )
+                continue
+
             board = Board(fen)
-            engine = SearchEngine()
-            event_queue: asyncio.Queue[dict | None] = asyncio.Queue()
             loop = asyncio.get_running_loop()
+            differ = SnapshotDiffer()
+            channel = _SnapshotChannel(snapshot_max_queue)
 
             def on_snapshot(snapshot: SearchSnapshot) -> None:
-                loop.call_soon_threadsafe(event_queue.put_nowait, _serialize_snapshot(snapshot))
+                # Hand off the raw snapshot; encoding happens on the serializer
+                # thread so the search thread goes straight back to searching.
+                loop.call_soon_threadsafe(channel.push, snapshot)
 
             async def run_search() -> None:
+                message: str | None = None
                 try:
                     result = await asyncio.to_thread(
                         engine.search,
@@ -71,19 +165,21 @@ async def search_websocket(websocket: WebSocket) -> None:
                         on_snapshot,
                         snapshot_interval_ms,
                     )
-                    await event_queue.put(_serialize_complete(result))
+                    message = _serialize_complete(result)
                 except Exception as exc:  # noqa: BLE001
-                    await event_queue.put({"type": "error", "message": str(exc)})
+                    message = _encode({"type": "error", "message": str(exc)})
                 finally:
-                    await event_queue.put(None)
+                    channel.finish(message)
 
             worker = asyncio.create_task(run_search())
 
-            while True:
-                item = await event_queue.get()
-                if item is None:
-                    break
-                await websocket.send_json(item)
+            finished = False
+            while not finished:
+                await channel.wait()
+                batch, finished = channel.drain()
+                if batch:
+                    frame = await loop.run_in_executor(_SERIALIZER, _merge_batch, batch, differ)
+                    await websocket.send_text(frame)
 
             await worker
     except WebSocketDisconnect:
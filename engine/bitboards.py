@@ -3,6 +3,14 @@
 from __future__ import annotations
 
 MASK_64 = (1 << 64) - 1
+FILE_A = 0x0101010101010101
+FILE_MASKS = tuple(FILE_A << file_idx for file_idx in range(8))
+RANK_1 = 0xFF
+RANK_MASKS = tuple(RANK_1 << (8 * rank_idx) for rank_idx in range(8))
+ADJACENT_FILE_MASKS = tuple(
+    (FILE_MASKS[file_idx - 1] if file_idx > 0 else 0) | (FILE_MASKS[file_idx + 1] if file_idx < 7 else 0)
+    for file_idx in range(8)
+)
 
 
 def set_bit(bitboard: int, square: int) -> int:
@@ -26,6 +34,12 @@ def pop_lsb(bitboard: int) -> tuple[int, int]:
 
 
 def iter_bits(bitboard: int):
+    # Inlined LSB extraction: int.bit_length() is a single C call and beats both
+    # a pop_lsb() round-trip and a de Bruijn multiply/lookup in CPython.
+    # Hot loops in movegen and evaluation inline this same loop instead of
+    # calling here, because resuming the generator costs more than their
+    # per-square work.
     while bitboard:
-        square, bitboard = pop_lsb(bitboard)
-        yield square
+        lsb = bitboard & -bitboard
+        yield lsb.bit_length() - 1
+        bitboard ^= lsb
@@ -44,6 +44,22 @@ from .constants import (
     square_name,
 )
 from .move import Move
+from .zobrist import CASTLING_KEYS, EP_FILE_KEYS, PIECE_KEYS, SIDE_KEY
+
+
+# Rook origin and destination squares for each castle, keyed by king target.
+CASTLE_ROOK_SQUARES = {
+    G1: (1 << H1) | (1 << F1),
+    C1: (1 << A1) | (1 << D1),
+    G8: (1 << H8) | (1 << F8),
+    C8: (1 << A8) | (1 << D8),
+}
+CASTLE_ROOK_KEYS = {
+    G1: PIECE_KEYS[WR][H1] ^ PIECE_KEYS[WR][F1],
+    C1: PIECE_KEYS[WR][A1] ^ PIECE_KEYS[WR][D1],
+    G8: PIECE_KEYS[BR][H8] ^ PIECE_KEYS[BR][F8],
+    C8: PIECE_KEYS[BR][A8] ^ PIECE_KEYS[BR][D8],
+}
 
 
 @dataclass(slots=True)
@@ -54,6 +70,7 @@ class UndoState:
     en_passant: int | None
     halfmove_clock: int
     fullmove_number: int
+    zobrist_hash: int
 
 
 class Board:
@@ -66,6 +83,7 @@ class Board:
         "halfmove_clock",
         "fullmove_number",
         "history",
+        "zobrist_hash",
     )
 
     def __init__(self, fen: str = START_FEN):
@@ -77,6 +95,7 @@ class Board:
         self.halfmove_clock = 0
         self.fullmove_number = 1
         self.history: list[UndoState] = []
+        self.zobrist_hash = 0
         self.set_fen(fen)
 
     def reset(self) -> None:
@@ -88,6 +107,7 @@ class Board:
         self.halfmove_clock = 0
         self.fullmove_number = 1
         self.history.clear()
+        self.zobrist_hash = 0
 
     def set_fen(self, fen: str) -> None:
         self.reset()
@@ -136,6 +156,22 @@ class Board:
         self.fullmove_number = int(fullmove)
 
         self._recompute_occupancies()
+        self.zobrist_hash = self._compute_hash()
+
+    def copy(self) -> Board:
+        """Return an independent copy without re-parsing a FEN."""
+        clone = Board.__new__(Board)
+        clone.piece_bitboards = self.piece_bitboards.copy()
+        clone.occupancies = self.occupancies.copy()
+        clone.side_to_move = self.side_to_move
+        clone.castling_rights = self.castling_rights
+        clone.en_passant = self.en_passant
+        clone.halfmove_clock = self.halfmove_clock
+        clone.fullmove_number = self.fullmove_number
+        # Undo records are never mutated after creation, so sharing them is safe.
+        clone.history = self.history.copy()
+        clone.zobrist_hash = self.zobrist_hash
+        return clone
 
     def piece_on(self, square: int) -> int:
         for piece, bb in enumerate(self.piece_bitboards):
@@ -150,16 +186,17 @@ class Board:
 
         if self.piece_on(from_sq) != moving_piece:
             return False
-        if self.side_to_move == WHITE and moving_piece not in WHITE_PIECES:
+        # Piece codes are WP..WK (0-5) then BP..BK (6-11): colour is a range test.
+        if self.side_to_move == WHITE and not WP <= moving_piece <= WK:
             return False
-        if self.side_to_move == BLACK and moving_piece not in BLACK_PIECES:
+        if self.side_to_move == BLACK and not BP <= moving_piece <= BK:
             return False
 
         target_piece = self.piece_on(to_sq)
         if not move.is_en_passant and target_piece != PIECE_NONE:
-            if self.side_to_move == WHITE and target_piece in WHITE_PIECES:
+            if self.side_to_move == WHITE and target_piece <= WK:
                 return False
-            if self.side_to_move == BLACK and target_piece in BLACK_PIECES:
+            if self.side_to_move == BLACK and target_piece >= BP:
                 return False
 
         captured_piece = move.captured
@@ -185,10 +222,12 @@ class Board:
             en_passant=self.en_passant,
             halfmove_clock=self.halfmove_clock,
             fullmove_number=self.fullmove_number,
+            zobrist_hash=self.zobrist_hash,
         )
         self.history.append(undo)
 
         self.piece_bitboards[moving_piece] = clear_bit(self.piece_bitboards[moving_piece], from_sq)
+        self._toggle_occupancies(move, cap_sq, captured_piece)
 
         if move.is_en_passant:
             self.piece_bitboards[ep_captured] = clear_bit(self.piece_bitboards[ep_captured], cap_sq)
@@ -201,14 +240,27 @@ class Board:
 
         self.piece_bitboards[placed_piece] = set_bit(self.piece_bitboards[placed_piece], to_sq)
 
+        zobrist_hash = self.zobrist_hash ^ PIECE_KEYS[moving_piece][from_sq] ^ PIECE_KEYS[placed_piece][to_sq]
+        if move.is_en_passant:
+            zobrist_hash ^= PIECE_KEYS[ep_captured][cap_sq]
+        elif captured_piece != PIECE_NONE:
+            zobrist_hash ^= PIECE_KEYS[captured_piece][to_sq]
+
         if move.is_castle:
             self._move_rook_for_castle(to_sq)
+            zobrist_hash ^= CASTLE_ROOK_KEYS[to_sq]
 
+        zobrist_hash ^= CASTLING_KEYS[self.castling_rights]
         self._update_castling_rights(from_sq, to_sq, moving_piece, captured_piece)
+        zobrist_hash ^= CASTLING_KEYS[self.castling_rights]
 
+        if self.en_passant is not None:
+            zobrist_hash ^= EP_FILE_KEYS[self.en_passant % 8]
         self.en_passant = None
         if move.is_double_push:
             self.en_passant = to_sq - 8 if self.side_to_move == WHITE else to_sq + 8
+            zobrist_hash ^= EP_FILE_KEYS[self.en_passant % 8]
+        self.zobrist_hash = zobrist_hash ^ SIDE_KEY
 
         if moving_piece in (WP, BP) or captured_piece != PIECE_NONE:
             self.halfmove_clock = 0
@@ -219,7 +271,6 @@ class Board:
             self.fullmove_number += 1
 
         self.side_to_move = opposite(self.side_to_move)
-        self._recompute_occupancies()
         return True
 
     def unmake_move(self) -> bool:
@@ -246,19 +297,20 @@ class Board:
             self.piece_bitboards[moved_piece] = clear_bit(self.piece_bitboards[moved_piece], to_sq)
             self.piece_bitboards[moved_piece] = set_bit(self.piece_bitboards[moved_piece], from_sq)
 
+        cap_sq = -1
         if move.is_en_passant:
             cap_sq = to_sq - 8 if self.side_to_move == WHITE else to_sq + 8
             ep_captured = BP if self.side_to_move == WHITE else WP
             self.piece_bitboards[ep_captured] = set_bit(self.piece_bitboards[ep_captured], cap_sq)
         elif undo.captured_piece != PIECE_NONE:
             self.piece_bitboards[undo.captured_piece] = set_bit(self.piece_bitboards[undo.captured_piece], to_sq)
+        self._toggle_occupancies(move, cap_sq, undo.captured_piece)
 
         self.castling_rights = undo.castling_rights
         self.en_passant = undo.en_passant
         self.halfmove_clock = undo.halfmove_clock
         self.fullmove_number = undo.fullmove_number
-
-        self._recompute_occupancies()
+        self.zobrist_hash = undo.zobrist_hash
         return True
 
     def _move_rook_for_castle(self, king_to: int) -> None:
@@ -322,6 +374,34 @@ class Board:
             elif to_sq == A8:
                 self.castling_rights &= ~CASTLE_BLACK_QUEEN
 
+    def _toggle_occupancies(self, move: Move, cap_sq: int, captured_piece: int) -> None:
+        # XOR-ing the touched squares is its own inverse, so make and unmake
+        # share this with ``side_to_move`` set to the side that moved.
+        occupancies = self.occupancies
+        side = self.side_to_move
+        occupancies[side] ^= (1 << move.from_square) | (1 << move.to_square)
+        if move.is_castle:
+            occupancies[side] ^= CASTLE_ROOK_SQUARES[move.to_square]
+        if cap_sq != -1:
+            occupancies[opposite(side)] ^= 1 << cap_sq
+        elif captured_piece != PIECE_NONE:
+            occupancies[opposite(side)] ^= 1 << move.to_square
+        occupancies[BOTH] = occupancies[WHITE] | occupancies[BLACK]
+
+    def _compute_hash(self) -> int:
+        zobrist_hash = CASTLING_KEYS[self.castling_rights]
+        for piece, bb in enumerate(self.piece_bitboards):
+            keys = PIECE_KEYS[piece]
+            while bb:
+                lsb = bb & -bb
+                zobrist_hash ^= keys[lsb.bit_length() - 1]
+                bb ^= lsb
+        if self.en_passant is not None:
+            zobrist_hash ^= EP_FILE_KEYS[self.en_passant % 8]
+        if self.side_to_move == BLACK:
+            zobrist_hash ^= SIDE_KEY
+        return zobrist_hash
+
     def _recompute_occupancies(self) -> None:
         white_occ = 0
         black_occ = 0
@@ -343,6 +423,7 @@ class Board:
             self.en_passant,
             self.halfmove_clock,
             self.fullmove_number,
+            self.zobrist_hash,
         )
 
     def to_fen(self) -> str:
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
+from threading import Lock
 
-from .bitboards import iter_bits
+from .bitboards import ADJACENT_FILE_MASKS, FILE_MASKS, MASK_64, iter_bits
 from .board import Board
 from .constants import (
     BLACK,
@@ -12,11 +14,11 @@ from .constants import (
     BB,
     BK,
     BN,
+    BOTH,
     BP,
     BQ,
     BR,
     PIECE_SYMBOLS,
-    PIECE_NONE,
     WHITE,
     WHITE_PIECES,
     WB,
@@ -27,15 +29,12 @@ from .constants import (
     WR,
     square_name,
 )
+from .magic import bishop_attacks, queen_attacks, rook_attacks
 from .movegen import (
-    BISHOP_RAY_KEYS,
     KING_ATTACKS,
     KNIGHT_ATTACKS,
     PAWN_ATTACKS,
-    QUEEN_RAY_KEYS,
-    ROOK_RAY_KEYS,
-    RAYS,
-    is_square_attacked,
+    attacked_squares,
     king_square,
 )
 
@@ -49,6 +48,15 @@ PIECE_VALUES = {
     WK: 0,
 }
 
+
+def _mirror_sq(square: int) -> int:
+    file_idx = square % 8
+    rank_idx = square // 8
+    return (7 - rank_idx) * 8 + file_idx
+
+
+MIRROR = tuple(_mirror_sq(sq) for sq in range(64))
+
 # Piece-square tables for white; mirrored for black.
 PAWN_PST = (
     0, 0, 0, 0, 0, 0, 0, 0,
@@ -125,6 +133,13 @@ PST_BY_KIND = {
     WK: KING_PST,
 }
 
+# Per-piece tables indexed by square (WP..BK), with black's tables pre-mirrored
+# so the evaluation loop never has to flip squares at runtime.
+PST_BY_PIECE = tuple(
+    PST_BY_KIND[piece] if piece < BP else tuple(PST_BY_KIND[piece - 6][MIRROR[sq]] for sq in range(64))
+    for piece in range(12)
+)
+
 MOBILITY_WEIGHT = {
     WP: 1,
     WN: 4,
@@ -135,6 +150,37 @@ MOBILITY_WEIGHT = {
 }
 
 
+def _build_passed_pawn_front(side: int) -> tuple[int, ...]:
+    """Own and adjacent files on every rank ahead of the pawn, from ``side``'s view."""
+    table = []
+    for sq in range(64):
+        file_idx = sq % 8
+        rank_idx = sq // 8
+        if side == WHITE:
+            ahead = MASK_64 ^ ((1 << ((rank_idx + 1) * 8)) - 1)
+        else:
+            ahead = (1 << (rank_idx * 8)) - 1
+        table.append((FILE_MASKS[file_idx] | ADJACENT_FILE_MASKS[file_idx]) & ahead)
+    return tuple(table)
+
+
+PASSED_PAWN_FRONT = (_build_passed_pawn_front(WHITE), _build_passed_pawn_front(BLACK))
+
+KING_RING = tuple(KING_ATTACKS[sq] | (1 << sq) for sq in range(64))
+
+
+_SLIDER_ATTACKS = {
+    WB: bishop_attacks,
+    WR: rook_attacks,
+    WQ: queen_attacks,
+}
+
+
+# Evaluation term slots, in the order they appear in EvalDetails.components.
+COMP_MATERIAL, COMP_PST, COMP_MOBILITY, COMP_KING_SAFETY, COMP_PAWN_STRUCTURE = range(5)
+COMPONENT_KEYS = ("material", "pst", "mobility", "king_safety", "pawn_structure")
+
+
 @dataclass(slots=True)
 class EvalDetails:
     score_cp: int
@@ -146,10 +192,12 @@ class EvalDetails:
     heatmap: dict[str, int]
 
 
-def _mirror_sq(square: int) -> int:
-    file_idx = square % 8
-    rank_idx = square // 8
-    return (7 - rank_idx) * 8 + file_idx
+# Detailed evaluations are only taken at search roots, and each holds a
+# breakdown per piece, so a small LRU covers repeated analysis of a game.
+DETAIL_CACHE_SIZE = 1_024
+_DETAIL_CACHE: OrderedDict[int, EvalDetails] = OrderedDict()
+# API searches run on worker threads, which share this cache.
+_DETAIL_CACHE_LOCK = Lock()
 
 
 def _piece_side(piece: int) -> int:
@@ -161,95 +209,59 @@ def _piece_kind(piece: int) -> int:
 
 
 def _mobility_targets(board: Board, piece: int, square: int, side: int) -> int:
-    own_occ = board.occupancies[side]
+    occupancies = board.occupancies
+    not_own = ~occupancies[side]
 
     if piece in (WN, BN):
-        return (KNIGHT_ATTACKS[square] & ~own_occ).bit_count()
+        return (KNIGHT_ATTACKS[square] & not_own).bit_count()
     if piece in (WK, BK):
-        return (KING_ATTACKS[square] & ~own_occ).bit_count()
-
-    ray_keys: tuple[str, ...]
+        return (KING_ATTACKS[square] & not_own).bit_count()
     if piece in (WB, BB):
-        ray_keys = BISHOP_RAY_KEYS
-    elif piece in (WR, BR):
-        ray_keys = ROOK_RAY_KEYS
-    elif piece in (WQ, BQ):
-        ray_keys = QUEEN_RAY_KEYS
-    else:
-        # Pawns are handled directly in pressure maps and structure terms.
-        return 0
-
-    count = 0
-    own_set = WHITE_PIECES if side == WHITE else BLACK_PIECES
-    for key in ray_keys:
-        for target in RAYS[key][square]:
-            occupant = board.piece_on(target)
-            if occupant == PIECE_NONE:
-                count += 1
-                continue
-            if occupant not in own_set:
-                count += 1
-            break
-    return count
+        return (bishop_attacks(square, occupancies[BOTH]) & not_own).bit_count()
+    if piece in (WR, BR):
+        return (rook_attacks(square, occupancies[BOTH]) & not_own).bit_count()
+    if piece in (WQ, BQ):
+        return (queen_attacks(square, occupancies[BOTH]) & not_own).bit_count()
 
+    # Pawns are handled directly in pressure maps and structure terms.
+    return 0
 
-def _pawn_structure_terms(board: Board) -> dict[int, dict[int, int]]:
-    terms: dict[int, dict[int, int]] = {WHITE: {}, BLACK: {}}
-
-    for side, pawn_piece in ((WHITE, WP), (BLACK, BP)):
-        pawns = list(iter_bits(board.piece_bitboards[pawn_piece]))
-        enemy_pawns = list(iter_bits(board.piece_bitboards[BP if side == WHITE else WP]))
-
-        pawns_by_file: dict[int, list[int]] = {file_idx: [] for file_idx in range(8)}
-        enemy_by_file: dict[int, list[int]] = {file_idx: [] for file_idx in range(8)}
 
-        for sq in pawns:
-            pawns_by_file[sq % 8].append(sq)
-        for sq in enemy_pawns:
-            enemy_by_file[sq % 8].append(sq)
+def _pawn_structure_terms(board: Board) -> list[int]:
+    """Pawn structure delta per square; zero on squares without a pawn."""
+    terms = [0] * 64
 
-        for sq in pawns:
+    bbs = board.piece_bitboards
+    for side, pawn_piece in ((WHITE, WP), (BLACK, BP)):
+        pawn_bb = bbs[pawn_piece]
+        enemy_bb = bbs[BP if side == WHITE else WP]
+        passed_front = PASSED_PAWN_FRONT[side]
+
+        remaining = pawn_bb
+        while remaining:
+            lsb = remaining & -remaining
+            remaining ^= lsb
+            sq = lsb.bit_length() - 1
             file_idx = sq % 8
-            rank_idx = sq // 8
             delta = 0
 
-            if len(pawns_by_file[file_idx]) > 1:
+            if (pawn_bb & FILE_MASKS[file_idx]).bit_count() > 1:
                 delta -= 14
-
-            has_adjacent_friend = False
-            for adj in (file_idx - 1, file_idx + 1):
-                if 0 <= adj < 8 and pawns_by_file[adj]:
-                    has_adjacent_friend = True
-                    break
-            if not has_adjacent_friend:
+            if not pawn_bb & ADJACENT_FILE_MASKS[file_idx]:
                 delta -= 12
-
-            blocked = False
-            for ef in (file_idx - 1, file_idx, file_idx + 1):
-                if not 0 <= ef < 8:
-                    continue
-                for enemy_sq in enemy_by_file[ef]:
-                    enemy_rank = enemy_sq // 8
-                    if side == WHITE and enemy_rank > rank_idx:
-                        blocked = True
-                        break
-                    if side == BLACK and enemy_rank < rank_idx:
-                        blocked = True
-                        break
-                if blocked:
-                    break
-
-            if not blocked:
-                advance = rank_idx if side == WHITE else (7 - rank_idx)
+            if not enemy_bb & passed_front[sq]:
+                advance = sq // 8 if side == WHITE else 7 - sq // 8
                 delta += 20 + advance * 6
 
-            terms[side][sq] = delta
+            terms[sq] = delta
 
     return terms
 
 
-def _king_safety_terms(board: Board) -> dict[int, dict[int, int]]:
-    terms: dict[int, dict[int, int]] = {WHITE: {}, BLACK: {}}
+def _king_safety_terms(board: Board) -> list[int]:
+    """King safety score per square; zero everywhere but the two king squares."""
+    terms = [0] * 64
+    bbs = board.piece_bitboards
 
     for side in (WHITE, BLACK):
         ksq = king_square(board, side)
@@ -257,7 +269,7 @@ def _king_safety_terms(board: Board) -> dict[int, dict[int, int]]:
             continue
 
         opp = BLACK if side == WHITE else WHITE
-        own_pawn = WP if side == WHITE else BP
+        own_pawns = bbs[WP if side == WHITE else BP]
 
         shield = 0
         for offset in ((7, 8, 9) if side == WHITE else (-7, -8, -9)):
@@ -266,69 +278,65 @@ def _king_safety_terms(board: Board) -> dict[int, dict[int, int]]:
                 continue
             if abs((target % 8) - (ksq % 8)) > 1:
                 continue
-            if board.piece_on(target) == own_pawn:
+            if (own_pawns >> target) & 1:
                 shield += 6
             else:
                 shield -= 8
 
-        ring_penalty = 0
-        ring = KING_ATTACKS[ksq] | (1 << ksq)
-        for sq in iter_bits(ring):
-            if is_square_attacked(board, sq, opp):
-                ring_penalty -= 8
+        ring_penalty = -8 * (attacked_squares(board, opp) & KING_RING[ksq]).bit_count()
 
-        terms[side][ksq] = shield + ring_penalty
+        terms[ksq] = shield + ring_penalty
 
     return terms
 
 
 def _pressure_heatmap(board: Board) -> dict[str, int]:
-    heat = [0] * 64
-
-    def add_targets(mask: int, sign: int) -> None:
-        for target in iter_bits(mask):
-            heat[target] += sign
-
-    for side, pieces in ((WHITE, WHITE_PIECES), (BLACK, BLACK_PIECES)):
-        sign = 1 if side == WHITE else -1
-        own_set = WHITE_PIECES if side == WHITE else BLACK_PIECES
+    # One attack counter per square and side; bytearray increments stay in C
+    # instead of rebinding PyLong entries of a signed list.
+    counts = (bytearray(64), bytearray(64))
+
+    def add_targets(mask: int, side_counts: bytearray) -> None:
+        while mask:
+            lsb = mask & -mask
+            side_counts[lsb.bit_length() - 1] += 1
+            mask ^= lsb
+
+    bbs = board.piece_bitboards
+    occupancies = board.occupancies
+    occ_all = occupancies[BOTH]
+    for side in (WHITE, BLACK):
+        side_counts = counts[side]
 
-        pawn_piece = WP if side == WHITE else BP
-        for sq in iter_bits(board.piece_bitboards[pawn_piece]):
-            add_targets(PAWN_ATTACKS[side][sq], sign)
+        pawn_attacks = PAWN_ATTACKS[side]
+        for sq in iter_bits(bbs[WP if side == WHITE else BP]):
+            add_targets(pawn_attacks[sq], side_counts)
 
-        knight_piece = WN if side == WHITE else BN
-        for sq in iter_bits(board.piece_bitboards[knight_piece]):
-            add_targets(KNIGHT_ATTACKS[sq], sign)
+        for sq in iter_bits(bbs[WN if side == WHITE else BN]):
+            add_targets(KNIGHT_ATTACKS[sq], side_counts)
 
-        king_piece = WK if side == WHITE else BK
-        for sq in iter_bits(board.piece_bitboards[king_piece]):
-            add_targets(KING_ATTACKS[sq], sign)
+        for sq in iter_bits(bbs[WK if side == WHITE else BK]):
+            add_targets(KING_ATTACKS[sq], side_counts)
 
-        for piece, ray_keys in (
-            (WB if side == WHITE else BB, BISHOP_RAY_KEYS),
-            (WR if side == WHITE else BR, ROOK_RAY_KEYS),
-            (WQ if side == WHITE else BQ, QUEEN_RAY_KEYS),
+        not_own = ~occupancies[side]
+        for piece, slider_attacks in (
+            (WB if side == WHITE else BB, bishop_attacks),
+            (WR if side == WHITE else BR, rook_attacks),
+            (WQ if side == WHITE else BQ, queen_attacks),
         ):
-            for sq in iter_bits(board.piece_bitboards[piece]):
-                for key in ray_keys:
-                    for target in RAYS[key][sq]:
-                        occupant = board.piece_on(target)
-                        if occupant == PIECE_NONE:
-                            heat[target] += sign
-                            continue
-                        if occupant not in own_set:
-                            heat[target] += sign
-                        break
-
-    return {square_name(sq): val for sq, val in enumerate(heat) if val != 0}
+            for sq in iter_bits(bbs[piece]):
+                add_targets(slider_attacks(sq, occ_all) & not_own, side_counts)
+
+    white_counts, black_counts = counts
+    return {
+        square_name(sq): white_counts[sq] - black_counts[sq]
+        for sq in range(64)
+        if white_counts[sq] != black_counts[sq]
+    }
 
 
 def _evaluate(board: Board, collect_details: bool) -> tuple[int, dict | None]:
-    components = {
-        WHITE: {"material": 0, "pst": 0, "mobility": 0, "king_safety": 0, "pawn_structure": 0},
-        BLACK: {"material": 0, "pst": 0, "mobility": 0, "king_safety": 0, "pawn_structure": 0},
-    }
+    # components[side][COMP_*]; converted to named dicts only for the payload.
+    components = [[0] * len(COMPONENT_KEYS), [0] * len(COMPONENT_KEYS)]
 
     piece_breakdown: dict[str, dict[str, int | str]] = {}
     piece_values: dict[str, int] = {}
@@ -340,22 +348,23 @@ def _evaluate(board: Board, collect_details: bool) -> tuple[int, dict | None]:
         side = _piece_side(piece)
         kind = _piece_kind(piece)
         base = PIECE_VALUES[kind]
-        pst_table = PST_BY_KIND[kind]
+        pst_table = PST_BY_PIECE[piece]
         mobility_weight = MOBILITY_WEIGHT[kind]
+        side_components = components[side]
+        side_components[COMP_MATERIAL] += base * bb.bit_count()
 
         for sq in iter_bits(bb):
             sq_key = square_name(sq)
-            pst = pst_table[sq] if side == WHITE else pst_table[_mirror_sq(sq)]
+            pst = pst_table[sq]
             mobility = _mobility_targets(board, piece, sq, side) * mobility_weight
-            pawn_structure = pawn_terms[side].get(sq, 0)
-            king_safety = king_terms[side].get(sq, 0)
+            pawn_structure = pawn_terms[sq]
+            king_safety = king_terms[sq]
             total = base + pst + mobility + pawn_structure + king_safety
 
-            components[side]["material"] += base
-            components[side]["pst"] += pst
-            components[side]["mobility"] += mobility
-            components[side]["pawn_structure"] += pawn_structure
-            components[side]["king_safety"] += king_safety
+            side_components[COMP_PST] += pst
+            side_components[COMP_MOBILITY] += mobility
+            side_components[COMP_PAWN_STRUCTURE] += pawn_structure
+            side_components[COMP_KING_SAFETY] += king_safety
 
             if collect_details:
                 signed_total = total if side == WHITE else -total
@@ -372,17 +381,19 @@ def _evaluate(board: Board, collect_details: bool) -> tuple[int, dict | None]:
                     "signed_total": signed_total,
                 }
 
-    white_total = sum(components[WHITE].values())
-    black_total = sum(components[BLACK].values())
+    white_total = sum(components[WHITE])
+    black_total = sum(components[BLACK])
     white_minus_black = white_total - black_total
     score_cp = white_minus_black if board.side_to_move == WHITE else -white_minus_black
 
     if not collect_details:
         return score_cp, None
 
+    white_components = dict(zip(COMPONENT_KEYS, components[WHITE]))
+    black_components = dict(zip(COMPONENT_KEYS, components[BLACK]))
     net_components = {
-        key: components[WHITE][key] - components[BLACK][key]
-        for key in components[WHITE]
+        key: white_components[key] - black_components[key]
+        for key in COMPONENT_KEYS
     }
 
     payload = {
@@ -390,8 +401,8 @@ def _evaluate(board: Board, collect_details: bool) -> tuple[int, dict | None]:
         "score": round(score_cp / 100.0, 2),
         "white_minus_black": white_minus_black,
         "components": {
-            "white": components[WHITE],
-            "black": components[BLACK],
+            "white": white_components,
+            "black": black_components,
             "net": net_components,
         },
         "piece_values": piece_values,
@@ -401,14 +412,88 @@ def _evaluate(board: Board, collect_details: bool) -> tuple[int, dict | None]:
     return score_cp, payload
 
 
+def _evaluate_fast(board: Board) -> int:
+    """Score-only evaluation; must sum exactly the same terms as _evaluate."""
+    bbs = board.piece_bitboards
+    occ_all = board.occupancies[BOTH]
+    pawn_terms = _pawn_structure_terms(board)
+    king_terms = _king_safety_terms(board)
+    totals = [0, 0]
+
+    for side, pieces in ((WHITE, WHITE_PIECES), (BLACK, BLACK_PIECES)):
+        not_own = ~board.occupancies[side]
+        total = 0
+
+        for piece in pieces:
+            bb = bbs[piece]
+            if not bb:
+                continue
+            kind = _piece_kind(piece)
+            pst_table = PST_BY_PIECE[piece]
+            weight = MOBILITY_WEIGHT[kind]
+            total += PIECE_VALUES[kind] * bb.bit_count()
+
+            # Inlined LSB loops; see iter_bits.
+            if kind == WP:
+                while bb:
+                    lsb = bb & -bb
+                    sq = lsb.bit_length() - 1
+                    total += pst_table[sq] + pawn_terms[sq]
+                    bb ^= lsb
+            elif kind == WN:
+                while bb:
+                    lsb = bb & -bb
+                    sq = lsb.bit_length() - 1
+                    total += pst_table[sq] + (KNIGHT_ATTACKS[sq] & not_own).bit_count() * weight
+                    bb ^= lsb
+            elif kind == WK:
+                while bb:
+                    lsb = bb & -bb
+                    sq = lsb.bit_length() - 1
+                    total += pst_table[sq] + (KING_ATTACKS[sq] & not_own).bit_count() * weight + king_terms[sq]
+                    bb ^= lsb
+            else:
+                slider_attacks = _SLIDER_ATTACKS[kind]
+                while bb:
+                    lsb = bb & -bb
+                    sq = lsb.bit_length() - 1
+                    total += pst_table[sq] + (slider_attacks(sq, occ_all) & not_own).bit_count() * weight
+                    bb ^= lsb
+
+        totals[side] = total
+
+    white_minus_black = totals[WHITE] - totals[BLACK]
+    return white_minus_black if board.side_to_move == WHITE else -white_minus_black
+
+
 def evaluate(board: Board) -> int:
     """Return centipawn score from side-to-move perspective."""
-    score_cp, _ = _evaluate(board, collect_details=False)
-    return score_cp
+    return _evaluate_fast(board)
 
 
 def evaluate_detailed(board: Board) -> EvalDetails:
-    """Return centipawn score plus per-piece explainability breakdown."""
+    """Return centipawn score plus per-piece explainability breakdown.
+
+    Results are cached by zobrist hash and shared between callers, so the
+    returned maps must be treated as read-only.
+    """
+    key = board.zobrist_hash
+    with _DETAIL_CACHE_LOCK:
+        cached = _DETAIL_CACHE.get(key)
+        if cached is not None:
+            _DETAIL_CACHE.move_to_end(key)
+            return cached
+
+    # Evaluated outside the lock; concurrent misses on one key just both compute.
+    details = _evaluate_detailed(board)
+    with _DETAIL_CACHE_LOCK:
+        _DETAIL_CACHE[key] = details
+        if len(_DETAIL_CACHE) > DETAIL_CACHE_SIZE:
+            _DETAIL_CACHE.popitem(last=False)
+    return details
+
+
+def _evaluate_detailed(board: Board) -> EvalDetails:
     _, payload = _evaluate(board, collect_details=True)
     assert payload is not None
     return EvalDetails(
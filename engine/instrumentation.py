@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, field
 from time import perf_counter
 from typing import Callable
 
+import orjson
+
 
 @dataclass(slots=True)
 class SearchSnapshot:
@@ -22,9 +24,34 @@ class SearchSnapshot:
     heatmap: dict[str, int]
     cutoffs: int
     elapsed_ms: float
+    _json_cache: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Shallow on purpose: consumers only serialize the nested maps, so the
+        # recursive copy done by dataclasses.asdict() is wasted work.
+        return {
+            "depth": self.depth,
+            "nodes": self.nodes,
+            "nps": self.nps,
+            "current_move": self.current_move,
+            "pv": self.pv,
+            "eval": self.eval,
+            "eval_cp": self.eval_cp,
+            "candidate_moves": self.candidate_moves,
+            "piece_values": self.piece_values,
+            "piece_breakdown": self.piece_breakdown,
+            "heatmap": self.heatmap,
+            "cutoffs": self.cutoffs,
+            "elapsed_ms": self.elapsed_ms,
+        }
+
+    def to_json(self) -> str:
+        """Encode the snapshot message once; later calls reuse the cached text."""
+        if self._json_cache is None:
+            payload = self.to_dict()
+            payload["type"] = "snapshot"
+            self._json_cache = orjson.dumps(payload).decode()
+        return self._json_cache
 
 
 class SnapshotThrottle:
@@ -35,6 +62,10 @@ class SnapshotThrottle:
         self.callback = callback
         self._next_emit_at = 0.0
 
+    def should_emit(self) -> bool:
+        """Whether a non-forced emit would go out now; lets callers skip building it."""
+        return self.callback is not None and perf_counter() >= self._next_emit_at
+
     def emit(self, snapshot: SearchSnapshot, force: bool = False) -> None:
         if self.callback is None:
             return
@@ -43,3 +74,42 @@ class SnapshotThrottle:
         if force or now >= self._next_emit_at:
             self.callback(snapshot)
             self._next_emit_at = now + self.interval
+
+
+# Per-square maps that change little between consecutive snapshots.
+DIFF_FIELDS = ("piece_values", "piece_breakdown", "heatmap")
+
+
+class SnapshotDiffer:
+    """Encode successive snapshots with key-level deltas for the per-square maps.
+
+    The first snapshot is encoded in full. Later ones omit the ``DIFF_FIELDS``
+    maps and carry a ``diff`` entry instead: for every map that changed since
+    the previously encoded snapshot, the ``changed`` keys with their new values
+    and the ``removed`` keys. Maps missing from ``diff`` are unchanged.
+    """
+
+    def __init__(self) -> None:
+        self._previous: dict[str, dict] | None = None
+
+    def encode(self, snapshot: SearchSnapshot) -> str:
+        previous = self._previous
+        self._previous = {name: getattr(snapshot, name) for name in DIFF_FIELDS}
+        if previous is None:
+            return snapshot.to_json()
+
+        payload = snapshot.to_dict()
+        diff: dict[str, dict] = {}
+        for name in DIFF_FIELDS:
+            current = payload.pop(name)
+            before = previous[name]
+            if current is before:
+                continue
+            changed = {key: value for key, value in current.items() if key not in before or before[key] != value}
+            removed = [key for key in before if key not in current]
+            if changed or removed:
+                diff[name] = {"changed": changed, "removed": removed}
+
+        payload["type"] = "snapshot"
+        payload["diff"] = diff
+        return orjson.dumps(payload).decode()
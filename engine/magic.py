@@ -0,0 +1,125 @@
+"""Magic bitboard sliding attack tables for bishops, rooks and queens."""
+
+from __future__ import annotations
+
+from .bitboards import MASK_64
+
+ROOK_DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+BISHOP_DIRECTIONS = ((1, 1), (-1, 1), (1, -1), (-1, -1))
+
+# Plain (non-overlapping) magics, one per square, found offline by random
+# sparse search for index shift = 64 - popcount(mask).
+ROOK_MAGICS = (
+    0x0280005280204004, 0x0440100040082002, 0x0080100020008009, 0x0600060090082040,
+    0x1200090200209004, 0x5C80018004000200, 0x0200008312004C08, 0x8200104481040222,
+    0x8000802080004000, 0x4000804000802000, 0x0008802000100084, 0x000A004010082202,
+    0x0000808008000400, 0x1280800200040080, 0x0642002200012894, 0x0001000080410022,
+    0x1680848008204006, 0x0050124020004001, 0x0000828010012003, 0x1008008080100008,
+    0x2044008008008004, 0xC001080120044010, 0x001044000801B002, 0x001802001E48810C,
+    0x0081400880008564, 0x4910004140002001, 0x7040200100410010, 0x0008100080080082,
+    0x0100100500080100, 0x0C04020080040080, 0x4000102400680201, 0x0020004200008401,
+    0x0080002000404000, 0x0010004000402010, 0x0000401101002002, 0x2001880184801000,
+    0x08A0800800800400, 0x020A008002801400, 0x0100021004000108, 0x000000890200004C,
+    0x0040224000858000, 0x0824200450004001, 0x0880200041010018, 0x0001041000090020,
+    0x0444008040080800, 0x0001000400490002, 0x0032010002008080, 0x02004440810A0004,
+    0x4082008100204200, 0x0800201000400040, 0x0A04802210420200, 0x0040810800500180,
+    0x0060440008008280, 0x0042000810040200, 0xC400100182080400, 0x0244008420510200,
+    0x0000208000110C41, 0x0001001020804001, 0x0A031D004010A001, 0x4208900061084501,
+    0x0442000804112002, 0x08420004013008A2, 0x400202A11002180C, 0x0000088044110022,
+)
+
+BISHOP_MAGICS = (
+    0x0240021084090042, 0x0C08418404004600, 0x0004014202040120, 0x10680A0022008404,
+    0x8004042000000121, 0x0081042006000000, 0x0000881128A00500, 0x0422005208012804,
+    0x00420404102C0130, 0x320010D020808880, 0x0482082840408080, 0x04082C4101204010,
+    0x0820040420010000, 0x8100008804410200, 0x01A1010088200821, 0x2000009088882000,
+    0x0040A010040810B0, 0x4824C020010C0111, 0x8108082408102008, 0x0000842802004498,
+    0x2902201400A00081, 0x0505028080414000, 0x0142200400840400, 0x000021010C010410,
+    0x0020620110D42101, 0x4064044082080822, 0x1001064210008600, 0x0021080014004010,
+    0x0013011019004001, 0x8208020002412890, 0x300A2C1822108200, 0x0441010020208810,
+    0x0441300800D02104, 0x0041082010020400, 0x0808904400281800, 0x3800D10802040040,
+    0x1004104010840100, 0x0010108200202209, 0x00640802843220A4, 0x0004040028009480,
+    0x80C2100208102000, 0x1418820120001010, 0x0202001048004401, 0x0210020102422400,
+    0x4000200820815010, 0xA0400880A3004080, 0x80044C2C00500408, 0x0084A40400480020,
+    0x8042080202900010, 0x0006010402024400, 0x100E1A0200922800, 0x2002800884040005,
+    0x00020420E0410108, 0x2808A02510008300, 0x0020543006104810, 0x085010018534C000,
+    0x2241008800880420, 0x2000450068020800, 0x0800004080480820, 0x2000B84000420203,
+    0x8100087010020220, 0x0108003021034904, 0x2008500308610400, 0x102202082A0400C0,
+)
+
+
+def _relevant_mask(square: int, directions: tuple[tuple[int, int], ...]) -> int:
+    """Squares whose occupancy can block a slider, excluding board edges."""
+    file_idx = square % 8
+    rank_idx = square // 8
+    mask = 0
+    for df, dr in directions:
+        nf, nr = file_idx + df, rank_idx + dr
+        while 0 <= nf + df < 8 and 0 <= nr + dr < 8:
+            mask |= 1 << (nr * 8 + nf)
+            nf += df
+            nr += dr
+    return mask
+
+
+def _slow_attacks(square: int, occupancy: int, directions: tuple[tuple[int, int], ...]) -> int:
+    file_idx = square % 8
+    rank_idx = square // 8
+    attacks = 0
+    for df, dr in directions:
+        nf, nr = file_idx + df, rank_idx + dr
+        while 0 <= nf < 8 and 0 <= nr < 8:
+            target = 1 << (nr * 8 + nf)
+            attacks |= target
+            if occupancy & target:
+                break
+            nf += df
+            nr += dr
+    return attacks
+
+
+def _build_table(
+    magics: tuple[int, ...],
+    directions: tuple[tuple[int, int], ...],
+) -> tuple[list[int], list[int], list[list[int]]]:
+    masks = [0] * 64
+    shifts = [0] * 64
+    tables: list[list[int]] = []
+    for square in range(64):
+        mask = _relevant_mask(square, directions)
+        shift = 64 - mask.bit_count()
+        magic = magics[square]
+        table = [0] * (1 << mask.bit_count())
+
+        # Carry-Rippler enumeration of every occupancy subset of the mask.
+        subset = 0
+        while True:
+            table[((subset * magic) & MASK_64) >> shift] = _slow_attacks(square, subset, directions)
+            subset = (subset - mask) & mask
+            if subset == 0:
+                break
+
+        masks[square] = mask
+        shifts[square] = shift
+        tables.append(table)
+    return masks, shifts, tables
+
+
+ROOK_MASKS, ROOK_SHIFTS, ROOK_ATTACKS = _build_table(ROOK_MAGICS, ROOK_DIRECTIONS)
+BISHOP_MASKS, BISHOP_SHIFTS, BISHOP_ATTACKS = _build_table(BISHOP_MAGICS, BISHOP_DIRECTIONS)
+
+
+def bishop_attacks(square: int, occupancy: int) -> int:
+    return BISHOP_ATTACKS[square][
+        (((occupancy & BISHOP_MASKS[square]) * BISHOP_MAGICS[square]) & MASK_64) >> BISHOP_SHIFTS[square]
+    ]
+
+
+def rook_attacks(square: int, occupancy: int) -> int:
+    return ROOK_ATTACKS[square][
+        (((occupancy & ROOK_MASKS[square]) * ROOK_MAGICS[square]) & MASK_64) >> ROOK_SHIFTS[square]
+    ]
+
+
+def queen_attacks(square: int, occupancy: int) -> int:
+    return bishop_attacks(square, occupancy) | rook_attacks(square, occupancy)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .constants import PIECE_NONE
 
@@ -17,6 +17,15 @@ class Move:
     is_double_push: bool = False
     is_en_passant: bool = False
     is_castle: bool = False
+    # Search ordering score: captures, then promotions, then castling.
+    order_key: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "order_key",
+            (self.captured != PIECE_NONE) * 10_000 + (self.promotion != PIECE_NONE) * 8_000 + self.is_castle * 100,
+        )
 
     def uci(self) -> str:
         from_file = chr(ord("a") + (self.from_square % 8))
@@ -42,3 +51,41 @@ class Move:
 
     def __str__(self) -> str:
         return self.uci()
+
+
+# Moves are immutable, so generation hands out one shared instance per
+# distinct move instead of building a fresh dataclass every node. Keys pack
+# the fields like a 32-bit move word: from (bits 0-5), to (6-11), piece
+# (12-15), captured + 1 (16-19), promotion + 1 (20-23), then the three flags.
+_INTERNED: dict[int, Move] = {}
+
+
+def interned_move(
+    from_square: int,
+    to_square: int,
+    piece: int,
+    captured: int = PIECE_NONE,
+    promotion: int = PIECE_NONE,
+    is_double_push: bool = False,
+    is_en_passant: bool = False,
+    is_castle: bool = False,
+) -> Move:
+    key = (
+        from_square
+        | to_square << 6
+        | piece << 12
+        | (captured + 1) << 16
+        | (promotion + 1) << 20
+        | is_double_push << 24
+        | is_en_passant << 25
+        | is_castle << 26
+    )
+    move = _INTERNED.get(key)
+    if move is None:
+        # setdefault is atomic, so threads racing on a miss all get the one
+        # stored instance; search relies on identity to skip the TT move.
+        move = _INTERNED.setdefault(
+            key,
+            Move(from_square, to_square, piece, captured, promotion, is_double_push, is_en_passant, is_castle),
+        )
+    return move
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from .bitboards import iter_bits
+from typing import Callable
+
+from .bitboards import FILE_MASKS, MASK_64, RANK_MASKS, iter_bits
 from .board import Board
 from .constants import (
     A1,
@@ -14,6 +16,7 @@ from .constants import (
     BB,
     BK,
     BN,
+    BOTH,
     BP,
     BQ,
     BR,
@@ -44,26 +47,16 @@ from .constants import (
     WR,
     opposite,
 )
-from .move import Move
+from .magic import bishop_attacks, queen_attacks, rook_attacks
+from .move import Move, interned_move
 
 
 KNIGHT_DELTAS = ((1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2))
 KING_DELTAS = ((1, 1), (1, 0), (1, -1), (0, 1), (0, -1), (-1, 1), (-1, 0), (-1, -1))
 
-RAY_DIRECTIONS: dict[str, tuple[int, int]] = {
-    "N": (0, 1),
-    "S": (0, -1),
-    "E": (1, 0),
-    "W": (-1, 0),
-    "NE": (1, 1),
-    "NW": (-1, 1),
-    "SE": (1, -1),
-    "SW": (-1, -1),
-}
-
-BISHOP_RAY_KEYS = ("NE", "NW", "SE", "SW")
-ROOK_RAY_KEYS = ("N", "S", "E", "W")
-QUEEN_RAY_KEYS = BISHOP_RAY_KEYS + ROOK_RAY_KEYS
+# (file step, rank step) per sliding direction.
+NORTH, SOUTH, EAST, WEST = (0, 1), (0, -1), (1, 0), (-1, 0)
+NORTH_EAST, NORTH_WEST, SOUTH_EAST, SOUTH_WEST = (1, 1), (-1, 1), (1, -1), (-1, -1)
 
 
 def _in_bounds(file_idx: int, rank_idx: int) -> bool:
@@ -108,29 +101,67 @@ def _build_pawn_attacks(side: int) -> list[int]:
     return table
 
 
-def _build_rays() -> dict[str, list[list[int]]]:
-    rays: dict[str, list[list[int]]] = {key: [[] for _ in range(64)] for key in RAY_DIRECTIONS}
+def _build_ray(direction: tuple[int, int]) -> list[list[int]]:
+    """Squares visited from each square in ``direction``, nearest first."""
+    df, dr = direction
+    rays: list[list[int]] = []
     for sq_idx in range(64):
-        file_idx = sq_idx % 8
-        rank_idx = sq_idx // 8
-        for key, (df, dr) in RAY_DIRECTIONS.items():
-            nf, nr = file_idx + df, rank_idx + dr
-            line: list[int] = []
-            while _in_bounds(nf, nr):
-                line.append(_sq(nf, nr))
-                nf += df
-                nr += dr
-            rays[key][sq_idx] = line
+        nf, nr = sq_idx % 8 + df, sq_idx // 8 + dr
+        line: list[int] = []
+        while _in_bounds(nf, nr):
+            line.append(_sq(nf, nr))
+            nf += df
+            nr += dr
+        rays.append(line)
     return rays
 
 
-KNIGHT_ATTACKS = _build_leaper_attacks(KNIGHT_DELTAS)
-KING_ATTACKS = _build_leaper_attacks(KING_DELTAS)
-PAWN_ATTACKS = {
-    WHITE: _build_pawn_attacks(WHITE),
-    BLACK: _build_pawn_attacks(BLACK),
-}
-RAYS = _build_rays()
+# Lookup tables are frozen into tuples: immutable, compact, and PAWN_ATTACKS is
+# indexed by side directly instead of hashing into a dict.
+KNIGHT_ATTACKS = tuple(_build_leaper_attacks(KNIGHT_DELTAS))
+KING_ATTACKS = tuple(_build_leaper_attacks(KING_DELTAS))
+PAWN_ATTACKS = (
+    tuple(_build_pawn_attacks(WHITE)),
+    tuple(_build_pawn_attacks(BLACK)),
+)
+RAYS_N = _build_ray(NORTH)
+RAYS_S = _build_ray(SOUTH)
+RAYS_E = _build_ray(EAST)
+RAYS_W = _build_ray(WEST)
+RAYS_NE = _build_ray(NORTH_EAST)
+RAYS_NW = _build_ray(NORTH_WEST)
+RAYS_SE = _build_ray(SOUTH_EAST)
+RAYS_SW = _build_ray(SOUTH_WEST)
+BISHOP_RAYS = (RAYS_NE, RAYS_NW, RAYS_SE, RAYS_SW)
+ROOK_RAYS = (RAYS_N, RAYS_S, RAYS_E, RAYS_W)
+QUEEN_RAYS = BISHOP_RAYS + ROOK_RAYS
+
+
+def _build_between() -> list[list[int]]:
+    """Squares strictly between two squares sharing a line; 0 when not aligned."""
+    table = [[0] * 64 for _ in range(64)]
+    for ray_table in QUEEN_RAYS:
+        for sq_idx in range(64):
+            between = 0
+            for to_sq in ray_table[sq_idx]:
+                table[sq_idx][to_sq] = between
+                between |= 1 << to_sq
+    return table
+
+
+BETWEEN = tuple(tuple(row) for row in _build_between())
+
+
+# Squares that must be empty, and squares the king passes that must not be
+# attacked, for each castle.
+WHITE_KING_SIDE_EMPTY = (1 << F1) | (1 << G1)
+WHITE_KING_SIDE_SAFE = (1 << E1) | (1 << F1) | (1 << G1)
+WHITE_QUEEN_SIDE_EMPTY = (1 << B1) | (1 << C1) | (1 << D1)
+WHITE_QUEEN_SIDE_SAFE = (1 << E1) | (1 << D1) | (1 << C1)
+BLACK_KING_SIDE_EMPTY = (1 << F8) | (1 << G8)
+BLACK_KING_SIDE_SAFE = (1 << E8) | (1 << F8) | (1 << G8)
+BLACK_QUEEN_SIDE_EMPTY = (1 << B8) | (1 << C8) | (1 << D8)
+BLACK_QUEEN_SIDE_SAFE = (1 << E8) | (1 << D8) | (1 << C8)
 
 
 def king_square(board: Board, side: int) -> int:
@@ -140,54 +171,109 @@ def king_square(board: Board, side: int) -> int:
     return (king_bb & -king_bb).bit_length() - 1
 
 
-def _ray_targets(board: Board, from_sq: int, ray_keys: tuple[str, ...]) -> list[tuple[int, int]]:
-    targets: list[tuple[int, int]] = []
-    for key in ray_keys:
-        for to_sq in RAYS[key][from_sq]:
-            captured = board.piece_on(to_sq)
-            targets.append((to_sq, captured))
-            if captured != PIECE_NONE:
-                break
-    return targets
-
-
-def _is_attacked_on_rays(board: Board, square: int, ray_keys: tuple[str, ...], sliders: tuple[int, int]) -> bool:
-    for key in ray_keys:
-        for from_sq in RAYS[key][square]:
-            piece = board.piece_on(from_sq)
-            if piece == PIECE_NONE:
-                continue
-            if piece in sliders:
-                return True
-            break
-    return False
-
-
 def is_square_attacked(board: Board, square: int, by_side: int) -> bool:
+    bbs = board.piece_bitboards
     if by_side == WHITE:
-        if board.piece_bitboards[WP] & PAWN_ATTACKS[BLACK][square]:
+        if bbs[WP] & PAWN_ATTACKS[BLACK][square]:
             return True
-        if board.piece_bitboards[WN] & KNIGHT_ATTACKS[square]:
+        if bbs[WN] & KNIGHT_ATTACKS[square]:
             return True
-        if board.piece_bitboards[WK] & KING_ATTACKS[square]:
+        if bbs[WK] & KING_ATTACKS[square]:
             return True
-        if _is_attacked_on_rays(board, square, BISHOP_RAY_KEYS, (WB, WQ)):
+        diagonal = bbs[WB] | bbs[WQ]
+        straight = bbs[WR] | bbs[WQ]
+    else:
+        if bbs[BP] & PAWN_ATTACKS[WHITE][square]:
+            return True
+        if bbs[BN] & KNIGHT_ATTACKS[square]:
             return True
-        if _is_attacked_on_rays(board, square, ROOK_RAY_KEYS, (WR, WQ)):
+        if bbs[BK] & KING_ATTACKS[square]:
             return True
-        return False
+        diagonal = bbs[BB] | bbs[BQ]
+        straight = bbs[BR] | bbs[BQ]
 
-    if board.piece_bitboards[BP] & PAWN_ATTACKS[WHITE][square]:
-        return True
-    if board.piece_bitboards[BN] & KNIGHT_ATTACKS[square]:
-        return True
-    if board.piece_bitboards[BK] & KING_ATTACKS[square]:
+    # Slider attacks are symmetric: a bishop/rook on ``square`` sees exactly
+    # the sliders that see ``square``.
+    occ_all = board.occupancies[BOTH]
+    if diagonal and bishop_attacks(square, occ_all) & diagonal:
         return True
-    if _is_attacked_on_rays(board, square, BISHOP_RAY_KEYS, (BB, BQ)):
-        return True
-    if _is_attacked_on_rays(board, square, ROOK_RAY_KEYS, (BR, BQ)):
-        return True
-    return False
+    return bool(straight and rook_attacks(square, occ_all) & straight)
+
+
+def attacked_squares(board: Board, by_side: int) -> int:
+    """Bitboard of every square attacked by ``by_side``'s pieces."""
+    bbs = board.piece_bitboards
+    occ_all = board.occupancies[BOTH]
+    if by_side == WHITE:
+        pawn, knight, bishop, rook, queen, king = WHITE_PIECES
+        pawns = bbs[pawn]
+        attacks = (((pawns << 7) & ~FILE_MASKS[7]) | ((pawns << 9) & ~FILE_MASKS[0])) & MASK_64
+    else:
+        pawn, knight, bishop, rook, queen, king = BLACK_PIECES
+        pawns = bbs[pawn]
+        attacks = ((pawns >> 9) & ~FILE_MASKS[7]) | ((pawns >> 7) & ~FILE_MASKS[0])
+
+    # Inlined LSB loops; see iter_bits.
+    bb = bbs[knight]
+    while bb:
+        lsb = bb & -bb
+        attacks |= KNIGHT_ATTACKS[lsb.bit_length() - 1]
+        bb ^= lsb
+    bb = bbs[king]
+    while bb:
+        lsb = bb & -bb
+        attacks |= KING_ATTACKS[lsb.bit_length() - 1]
+        bb ^= lsb
+    bb = bbs[bishop] | bbs[queen]
+    while bb:
+        lsb = bb & -bb
+        attacks |= bishop_attacks(lsb.bit_length() - 1, occ_all)
+        bb ^= lsb
+    bb = bbs[rook] | bbs[queen]
+    while bb:
+        lsb = bb & -bb
+        attacks |= rook_attacks(lsb.bit_length() - 1, occ_all)
+        bb ^= lsb
+    return attacks
+
+
+def compute_checkers_and_pins(board: Board, side: int) -> tuple[int, int, list[int]]:
+    """Pieces checking ``side``'s king, ``side``'s pinned pieces, and each pin's legal ray.
+
+    ``pin_rays[sq]`` is the line from the king up to and including the pinning
+    slider, i.e. the only squares a piece pinned on ``sq`` may move to.
+    """
+    bbs = board.piece_bitboards
+    occ_all = board.occupancies[BOTH]
+    own_occ = board.occupancies[side]
+    pin_rays = [0] * 64
+    ksq = king_square(board, side)
+    if ksq == -1:
+        return 0, 0, pin_rays
+
+    if side == WHITE:
+        checkers = (bbs[BP] & PAWN_ATTACKS[WHITE][ksq]) | (bbs[BN] & KNIGHT_ATTACKS[ksq])
+        diagonal = bbs[BB] | bbs[BQ]
+        straight = bbs[BR] | bbs[BQ]
+    else:
+        checkers = (bbs[WP] & PAWN_ATTACKS[BLACK][ksq]) | (bbs[WN] & KNIGHT_ATTACKS[ksq])
+        diagonal = bbs[WB] | bbs[WQ]
+        straight = bbs[WR] | bbs[WQ]
+
+    # Sliders that would hit the king on an empty board either check it, pin
+    # exactly one of our pieces, or are blocked by two or more pieces.
+    pinned = 0
+    between_king = BETWEEN[ksq]
+    snipers = (bishop_attacks(ksq, 0) & diagonal) | (rook_attacks(ksq, 0) & straight)
+    for sniper_sq in iter_bits(snipers):
+        ray = between_king[sniper_sq]
+        blockers = ray & occ_all
+        if not blockers:
+            checkers |= 1 << sniper_sq
+        elif blockers & (blockers - 1) == 0 and blockers & own_occ:
+            pinned |= blockers
+            pin_rays[blockers.bit_length() - 1] = ray | (1 << sniper_sq)
+    return checkers, pinned, pin_rays
 
 
 def in_check(board: Board, side: int) -> bool:
@@ -197,267 +283,246 @@ def in_check(board: Board, side: int) -> bool:
     return is_square_attacked(board, ksq, opposite(side))
 
 
-def _append_pawn_move(
+def _append_pawn_moves(
     moves: list[Move],
-    from_sq: int,
-    to_sq: int,
-    pawn_piece: int,
-    captured: int,
+    targets: int,
+    delta: int,
+    pawn: int,
     promotion_rank: int,
-    is_double_push: bool = False,
-    is_en_passant: bool = False,
+    promotions: tuple[int, ...],
+    piece_on: Callable[[int], int] | None = None,
 ) -> None:
-    target_rank = to_sq // 8
-    if target_rank == promotion_rank:
-        promotions = (WQ, WR, WB, WN) if pawn_piece == WP else (BQ, BR, BB, BN)
-        for promoted in promotions:
-            moves.append(
-                Move(
-                    from_square=from_sq,
-                    to_square=to_sq,
-                    piece=pawn_piece,
-                    captured=captured,
-                    promotion=promoted,
-                    is_double_push=False,
-                    is_en_passant=is_en_passant,
-                    is_castle=False,
-                )
-            )
-        return
+    """One pawn move per bit of ``targets``, each from ``to_sq - delta``.
+
+    ``piece_on`` is passed for captures; targets on ``promotion_rank`` expand
+    into one move per promotion piece.
+    """
+    append = moves.append
+    while targets:
+        to_bb = targets & -targets
+        targets ^= to_bb
+        to_sq = to_bb.bit_length() - 1
+        from_sq = to_sq - delta
+        captured = piece_on(to_sq) if piece_on is not None else PIECE_NONE
+        if to_bb & promotion_rank:
+            for promoted in promotions:
+                append(interned_move(from_sq, to_sq, pawn, captured, promoted))
+        else:
+            append(interned_move(from_sq, to_sq, pawn, captured))
 
-    moves.append(
-        Move(
-            from_square=from_sq,
-            to_square=to_sq,
-            piece=pawn_piece,
-            captured=captured,
-            promotion=PIECE_NONE,
-            is_double_push=is_double_push,
-            is_en_passant=is_en_passant,
-            is_castle=False,
-        )
-    )
-
-
-def _generate_pawn_moves(board: Board, moves: list[Move]) -> None:
-    side = board.side_to_move
-    if side == WHITE:
+
+def _generate_pawn_moves(board: Board, moves: list[Move], captures: bool = True, quiets: bool = True) -> None:
+    """Pawn moves for all pawns at once by shifting the pawn bitboard.
+
+    ``captures`` covers captures, en passant and every promotion (pushes onto
+    the last rank included); ``quiets`` covers the remaining pushes.
+    """
+    occupancies = board.occupancies
+    empty = ~occupancies[BOTH] & MASK_64
+    if board.side_to_move == WHITE:
+        pawn = WP
         pawns = board.piece_bitboards[WP]
-        for from_sq in iter_bits(pawns):
-            file_idx = from_sq % 8
-            rank_idx = from_sq // 8
-
-            one_up = from_sq + 8
-            if one_up < 64 and board.piece_on(one_up) == PIECE_NONE:
-                _append_pawn_move(moves, from_sq, one_up, WP, PIECE_NONE, promotion_rank=7)
-                if rank_idx == 1:
-                    two_up = from_sq + 16
-                    if board.piece_on(two_up) == PIECE_NONE:
-                        moves.append(Move(from_square=from_sq, to_square=two_up, piece=WP, is_double_push=True))
-
-            if file_idx > 0:
-                capture = from_sq + 7
-                if capture < 64:
-                    target = board.piece_on(capture)
-                    if target in BLACK_PIECES:
-                        _append_pawn_move(moves, from_sq, capture, WP, target, promotion_rank=7)
-                    elif board.en_passant == capture:
-                        _append_pawn_move(
-                            moves,
-                            from_sq,
-                            capture,
-                            WP,
-                            PIECE_NONE,
-                            promotion_rank=7,
-                            is_en_passant=True,
-                        )
-
-            if file_idx < 7:
-                capture = from_sq + 9
-                if capture < 64:
-                    target = board.piece_on(capture)
-                    if target in BLACK_PIECES:
-                        _append_pawn_move(moves, from_sq, capture, WP, target, promotion_rank=7)
-                    elif board.en_passant == capture:
-                        _append_pawn_move(
-                            moves,
-                            from_sq,
-                            capture,
-                            WP,
-                            PIECE_NONE,
-                            promotion_rank=7,
-                            is_en_passant=True,
-                        )
+        enemies = occupancies[BLACK]
+        promotion_rank = RANK_MASKS[7]
+        promotions = (WQ, WR, WB, WN)
+        push_delta, west_delta, east_delta = 8, 7, 9
+        pushes = (pawns << 8) & empty
+        double_pushes = ((pushes & RANK_MASKS[2]) << 8) & empty
+        west_captures = (pawns << 7) & ~FILE_MASKS[7] & enemies
+        east_captures = (pawns << 9) & ~FILE_MASKS[0] & enemies
+        ep_attackers = PAWN_ATTACKS[BLACK]
     else:
+        pawn = BP
         pawns = board.piece_bitboards[BP]
-        for from_sq in iter_bits(pawns):
-            file_idx = from_sq % 8
-            rank_idx = from_sq // 8
-
-            one_down = from_sq - 8
-            if one_down >= 0 and board.piece_on(one_down) == PIECE_NONE:
-                _append_pawn_move(moves, from_sq, one_down, BP, PIECE_NONE, promotion_rank=0)
-                if rank_idx == 6:
-                    two_down = from_sq - 16
-                    if board.piece_on(two_down) == PIECE_NONE:
-                        moves.append(Move(from_square=from_sq, to_square=two_down, piece=BP, is_double_push=True))
-
-            if file_idx > 0:
-                capture = from_sq - 9
-                if capture >= 0:
-                    target = board.piece_on(capture)
-                    if target in WHITE_PIECES:
-                        _append_pawn_move(moves, from_sq, capture, BP, target, promotion_rank=0)
-                    elif board.en_passant == capture:
-                        _append_pawn_move(
-                            moves,
-                            from_sq,
-                            capture,
-                            BP,
-                            PIECE_NONE,
-                            promotion_rank=0,
-                            is_en_passant=True,
-                        )
-
-            if file_idx < 7:
-                capture = from_sq - 7
-                if capture >= 0:
-                    target = board.piece_on(capture)
-                    if target in WHITE_PIECES:
-                        _append_pawn_move(moves, from_sq, capture, BP, target, promotion_rank=0)
-                    elif board.en_passant == capture:
-                        _append_pawn_move(
-                            moves,
-                            from_sq,
-                            capture,
-                            BP,
-                            PIECE_NONE,
-                            promotion_rank=0,
-                            is_en_passant=True,
-                        )
-
-
-def _generate_leaper_moves(board: Board, moves: list[Move], piece: int, attack_table: list[int]) -> None:
+        enemies = occupancies[WHITE]
+        promotion_rank = RANK_MASKS[0]
+        promotions = (BQ, BR, BB, BN)
+        push_delta, west_delta, east_delta = -8, -9, -7
+        pushes = (pawns >> 8) & empty
+        double_pushes = ((pushes & RANK_MASKS[5]) >> 8) & empty
+        west_captures = (pawns >> 9) & ~FILE_MASKS[7] & enemies
+        east_captures = (pawns >> 7) & ~FILE_MASKS[0] & enemies
+        ep_attackers = PAWN_ATTACKS[WHITE]
+
+    if captures:
+        piece_on = board.piece_on
+        _append_pawn_moves(moves, west_captures, west_delta, pawn, promotion_rank, promotions, piece_on)
+        _append_pawn_moves(moves, east_captures, east_delta, pawn, promotion_rank, promotions, piece_on)
+
+        en_passant = board.en_passant
+        if en_passant is not None:
+            # Our pawns that could capture onto the square are those a pawn of
+            # the other colour standing there would attack.
+            sources = ep_attackers[en_passant] & pawns
+            while sources:
+                lsb = sources & -sources
+                sources ^= lsb
+                moves.append(interned_move(lsb.bit_length() - 1, en_passant, pawn, is_en_passant=True))
+
+    if not quiets:
+        pushes &= promotion_rank
+    else:
+        if not captures:
+            pushes &= ~promotion_rank
+        append = moves.append
+        while double_pushes:
+            to_bb = double_pushes & -double_pushes
+            double_pushes ^= to_bb
+            to_sq = to_bb.bit_length() - 1
+            append(interned_move(to_sq - 2 * push_delta, to_sq, pawn, is_double_push=True))
+    _append_pawn_moves(moves, pushes, push_delta, pawn, promotion_rank, promotions)
+
+
+def _generate_piece_moves(board: Board, moves: list[Move], captures: bool = True, quiets: bool = True) -> None:
+    """Knight, bishop, rook, queen and king moves for the side to move in one pass.
+
+    Every piece type is reduced to a target bitboard (leaper table or magic
+    lookup, minus own pieces), so the per-piece work is shared and only
+    captures touch the board's piece lookup.
+    """
     side = board.side_to_move
-    own_occ = board.occupancies[side]
-
-    for from_sq in iter_bits(board.piece_bitboards[piece]):
-        targets = attack_table[from_sq] & ~own_occ
-        for to_sq in iter_bits(targets):
-            moves.append(
-                Move(
-                    from_square=from_sq,
-                    to_square=to_sq,
-                    piece=piece,
-                    captured=board.piece_on(to_sq),
-                )
-            )
-
-
-def _generate_slider_moves(board: Board, moves: list[Move], piece: int, ray_keys: tuple[str, ...]) -> None:
-    own_set = WHITE_PIECES if board.side_to_move == WHITE else BLACK_PIECES
-    for from_sq in iter_bits(board.piece_bitboards[piece]):
-        for key in ray_keys:
-            for to_sq in RAYS[key][from_sq]:
-                captured = board.piece_on(to_sq)
-                if captured == PIECE_NONE:
-                    moves.append(Move(from_square=from_sq, to_square=to_sq, piece=piece))
-                    continue
-                if captured not in own_set:
-                    moves.append(Move(from_square=from_sq, to_square=to_sq, piece=piece, captured=captured))
-                break
+    bbs = board.piece_bitboards
+    occ_all = board.occupancies[BOTH]
+    # ``not_own`` is the target mask: enemy pieces, empty squares, or both.
+    not_own = 0
+    if captures:
+        not_own |= board.occupancies[opposite(side)]
+    if quiets:
+        not_own |= ~occ_all & MASK_64
+    piece_on = board.piece_on
+    append = moves.append
+    _, knight, bishop, rook, queen, king = WHITE_PIECES if side == WHITE else BLACK_PIECES
+
+    for piece in (knight, bishop, rook, queen, king):
+        pieces = bbs[piece]
+        while pieces:
+            lsb = pieces & -pieces
+            pieces ^= lsb
+            from_sq = lsb.bit_length() - 1
+            if piece == knight:
+                targets = KNIGHT_ATTACKS[from_sq] & not_own
+            elif piece == bishop:
+                targets = bishop_attacks(from_sq, occ_all) & not_own
+            elif piece == rook:
+                targets = rook_attacks(from_sq, occ_all) & not_own
+            elif piece == queen:
+                targets = queen_attacks(from_sq, occ_all) & not_own
+            else:
+                targets = KING_ATTACKS[from_sq] & not_own
+
+            while targets:
+                to_bb = targets & -targets
+                targets ^= to_bb
+                to_sq = to_bb.bit_length() - 1
+                if occ_all & to_bb:
+                    append(interned_move(from_sq, to_sq, piece, piece_on(to_sq)))
+                else:
+                    append(interned_move(from_sq, to_sq, piece))
 
 
 def _generate_castling(board: Board, moves: list[Move]) -> None:
+    # The opponent's attack map is built at most once, and only when a castle
+    # has rights, an empty path and its rook in place.
     side = board.side_to_move
+    bbs = board.piece_bitboards
+    occ_all = board.occupancies[BOTH]
     if side == WHITE:
-        if board.piece_on(E1) != WK:
+        rights = board.castling_rights & (CASTLE_WHITE_KING | CASTLE_WHITE_QUEEN)
+        if not rights or not bbs[WK] & (1 << E1):
             return
-
-        if board.castling_rights & CASTLE_WHITE_KING:
-            if (
-                board.piece_on(F1) == PIECE_NONE
-                and board.piece_on(G1) == PIECE_NONE
-                and board.piece_on(H1) == WR
-                and not is_square_attacked(board, E1, BLACK)
-                and not is_square_attacked(board, F1, BLACK)
-                and not is_square_attacked(board, G1, BLACK)
-            ):
-                moves.append(Move(from_square=E1, to_square=G1, piece=WK, is_castle=True))
-
-        if board.castling_rights & CASTLE_WHITE_QUEEN:
-            if (
-                board.piece_on(B1) == PIECE_NONE
-                and board.piece_on(C1) == PIECE_NONE
-                and board.piece_on(D1) == PIECE_NONE
-                and board.piece_on(A1) == WR
-                and not is_square_attacked(board, E1, BLACK)
-                and not is_square_attacked(board, D1, BLACK)
-                and not is_square_attacked(board, C1, BLACK)
-            ):
-                moves.append(Move(from_square=E1, to_square=C1, piece=WK, is_castle=True))
+        attacked: int | None = None
+        if rights & CASTLE_WHITE_KING and not occ_all & WHITE_KING_SIDE_EMPTY and bbs[WR] & (1 << H1):
+            attacked = attacked_squares(board, BLACK)
+            if not attacked & WHITE_KING_SIDE_SAFE:
+                moves.append(interned_move(E1, G1, WK, is_castle=True))
+        if rights & CASTLE_WHITE_QUEEN and not occ_all & WHITE_QUEEN_SIDE_EMPTY and bbs[WR] & (1 << A1):
+            if attacked is None:
+                attacked = attacked_squares(board, BLACK)
+            if not attacked & WHITE_QUEEN_SIDE_SAFE:
+                moves.append(interned_move(E1, C1, WK, is_castle=True))
         return
 
-    if board.piece_on(E8) != BK:
+    rights = board.castling_rights & (CASTLE_BLACK_KING | CASTLE_BLACK_QUEEN)
+    if not rights or not bbs[BK] & (1 << E8):
         return
-
-    if board.castling_rights & CASTLE_BLACK_KING:
-        if (
-            board.piece_on(F8) == PIECE_NONE
-            and board.piece_on(G8) == PIECE_NONE
-            and board.piece_on(H8) == BR
-            and not is_square_attacked(board, E8, WHITE)
-            and not is_square_attacked(board, F8, WHITE)
-            and not is_square_attacked(board, G8, WHITE)
-        ):
-            moves.append(Move(from_square=E8, to_square=G8, piece=BK, is_castle=True))
-
-    if board.castling_rights & CASTLE_BLACK_QUEEN:
-        if (
-            board.piece_on(B8) == PIECE_NONE
-            and board.piece_on(C8) == PIECE_NONE
-            and board.piece_on(D8) == PIECE_NONE
-            and board.piece_on(A8) == BR
-            and not is_square_attacked(board, E8, WHITE)
-            and not is_square_attacked(board, D8, WHITE)
-            and not is_square_attacked(board, C8, WHITE)
-        ):
-            moves.append(Move(from_square=E8, to_square=C8, piece=BK, is_castle=True))
+    attacked: int | None = None
+    if rights & CASTLE_BLACK_KING and not occ_all & BLACK_KING_SIDE_EMPTY and bbs[BR] & (1 << H8):
+        attacked = attacked_squares(board, WHITE)
+        if not attacked & BLACK_KING_SIDE_SAFE:
+            moves.append(interned_move(E8, G8, BK, is_castle=True))
+    if rights & CASTLE_BLACK_QUEEN and not occ_all & BLACK_QUEEN_SIDE_EMPTY and bbs[BR] & (1 << A8):
+        if attacked is None:
+            attacked = attacked_squares(board, WHITE)
+        if not attacked & BLACK_QUEEN_SIDE_SAFE:
+            moves.append(interned_move(E8, C8, BK, is_castle=True))
 
 
 def generate_pseudo_legal_moves(board: Board) -> list[Move]:
     moves: list[Move] = []
-    side = board.side_to_move
-
     _generate_pawn_moves(board, moves)
+    _generate_piece_moves(board, moves)
+    _generate_castling(board, moves)
+    return moves
+
+
+def generate_captures(board: Board) -> list[Move]:
+    """Legal captures, en passant and promotions: the quiescence search moves."""
+    moves: list[Move] = []
+    _generate_pawn_moves(board, moves, quiets=False)
+    _generate_piece_moves(board, moves, quiets=False)
+    return _filter_legal(board, moves)
 
-    if side == WHITE:
-        _generate_leaper_moves(board, moves, WN, KNIGHT_ATTACKS)
-        _generate_slider_moves(board, moves, WB, BISHOP_RAY_KEYS)
-        _generate_slider_moves(board, moves, WR, ROOK_RAY_KEYS)
-        _generate_slider_moves(board, moves, WQ, QUEEN_RAY_KEYS)
-        _generate_leaper_moves(board, moves, WK, KING_ATTACKS)
-    else:
-        _generate_leaper_moves(board, moves, BN, KNIGHT_ATTACKS)
-        _generate_slider_moves(board, moves, BB, BISHOP_RAY_KEYS)
-        _generate_slider_moves(board, moves, BR, ROOK_RAY_KEYS)
-        _generate_slider_moves(board, moves, BQ, QUEEN_RAY_KEYS)
-        _generate_leaper_moves(board, moves, BK, KING_ATTACKS)
 
+def generate_quiets(board: Board) -> list[Move]:
+    """Legal non-capturing, non-promoting moves; with generate_captures, all legal moves."""
+    moves: list[Move] = []
+    _generate_pawn_moves(board, moves, captures=False)
+    _generate_piece_moves(board, moves, captures=False)
     _generate_castling(board, moves)
-    return moves
+    return _filter_legal(board, moves)
 
 
 def generate_legal_moves(board: Board) -> list[Move]:
+    return _filter_legal(board, generate_pseudo_legal_moves(board))
+
+
+def _filter_legal(board: Board, pseudo_moves: list[Move]) -> list[Move]:
     legal_moves: list[Move] = []
     side = board.side_to_move
-
-    for move in generate_pseudo_legal_moves(board):
-        if not board.make_move(move):
+    ksq = king_square(board, side)
+    if ksq == -1:
+        return legal_moves
+
+    checkers, pinned, pin_rays = compute_checkers_and_pins(board, side)
+    king = WK if side == WHITE else BK
+    if checkers == 0:
+        evasion_mask = MASK_64
+    elif checkers & (checkers - 1) == 0:
+        evasion_mask = BETWEEN[ksq][checkers.bit_length() - 1] | checkers
+    else:
+        evasion_mask = 0
+
+    # With no check and no pins every other move is legal as generated.
+    constrained = evasion_mask != MASK_64 or pinned != 0
+    append = legal_moves.append
+    for move in pseudo_moves:
+        if move.piece == king or move.is_en_passant:
+            # King steps and en passant (which can expose a rank check) are
+            # still verified on the board.
+            if not board.make_move(move):
+                continue
+            illegal = in_check(board, side)
+            board.unmake_move()
+            if not illegal:
+                append(move)
             continue
-        illegal = in_check(board, side)
-        board.unmake_move()
-        if not illegal:
-            legal_moves.append(move)
+
+        if constrained:
+            to_bb = 1 << move.to_square
+            if not to_bb & evasion_mask:
+                continue
+            if pinned & (1 << move.from_square) and not to_bb & pin_rays[move.from_square]:
+                continue
+        append(move)
 
     return legal_moves
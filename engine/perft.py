@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Iterator
+
 from .board import Board
 from .movegen import generate_legal_moves
 
@@ -25,13 +30,45 @@ def perft(board: Board, depth: int) -> int:
 
 
 def perft_divide(board: Board, depth: int) -> dict[str, int]:
+    return dict(perft_divide_iter(board, depth))
+
+
+def perft_divide_iter(board: Board, depth: int, workers: int = 1) -> Iterator[tuple[str, int]]:
+    """Yield ``(uci, count)`` per root move, in UCI order, as each subtree finishes.
+
+    With ``workers > 1`` the root subtrees are counted in a process pool.
+    """
     if depth < 1:
         raise ValueError("Depth must be >= 1 for perft divide")
+    if workers > 1:
+        return _divide_parallel(board, depth, workers)
+    return _divide(board, depth)
+
 
-    result: dict[str, int] = {}
-    for move in generate_legal_moves(board):
+def _divide(board: Board, depth: int) -> Iterator[tuple[str, int]]:
+    for uci, move in sorted((move.uci(), move) for move in generate_legal_moves(board)):
         board.make_move(move)
         count = perft(board, depth - 1)
         board.unmake_move()
-        result[move.uci()] = count
-    return dict(sorted(result.items()))
+        yield uci, count
+
+
+def _divide_parallel(board: Board, depth: int, workers: int) -> Iterator[tuple[str, int]]:
+    ucis: list[str] = []
+    fens: list[str] = []
+    for uci, move in sorted((move.uci(), move) for move in generate_legal_moves(board)):
+        board.make_move(move)
+        fens.append(board.to_fen())
+        board.unmake_move()
+        ucis.append(uci)
+
+    # Spawned rather than forked, matching the search worker pool.
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as pool:
+        yield from zip(ucis, pool.map(_perft_fen, fens, repeat(depth - 1)))
+
+
+def _perft_fen(fen: str, depth: int) -> int:
+    return perft(Board(fen), depth)
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
-from time import perf_counter
-from typing import Callable
+from operator import attrgetter
+from time import perf_counter, time
+from typing import Callable, Iterator
 
 from .board import Board
-from .evaluation import evaluate, evaluate_detailed, terminal_score
+from .constants import PIECE_NONE, SQUARE_TO_INDEX, SQUARES, WP
+from .evaluation import PIECE_VALUES, evaluate, evaluate_detailed, terminal_score
 from .instrumentation import SearchSnapshot, SnapshotThrottle
 from .move import Move
-from .movegen import generate_legal_moves, in_check
+from .movegen import generate_captures, generate_legal_moves, generate_quiets, in_check
 
 
 @dataclass(slots=True)
@@ -39,16 +43,49 @@ class SearchResult:
     heatmap: dict[str, int]
 
 
+_ORDER_KEY = attrgetter("order_key")
+# Interior nodes read the clock once per 256 nodes (~15 ms at current speed);
+# root moves still check on every move.
+TIMEOUT_CHECK_MASK = 0xFF
+MAX_PLY = 64
+
+# Transposition table bound flags and sizing. An entry (dict slot, tuple and
+# move) costs roughly 184 bytes, so the default cap holds the table near 24 MB
+# per engine; the API keeps one engine per connection.
+TT_EXACT, TT_LOWER, TT_UPPER = range(3)
+TT_MAX_ENTRIES = 1 << 17
+# Mate scores are stored relative to the node so they stay valid at any ply.
+MATE_THRESHOLD = 100_000 - 1_000
+KILLER_ORDER = 1_000
+# Quiescence captures that cannot lift the score to within this margin of
+# alpha are skipped (delta pruning).
+DELTA_MARGIN = 200
+
+
 class _SearchTimeout(Exception):
     pass
 
 
 class SearchEngine:
-    def __init__(self) -> None:
+    def __init__(self, workers: int = 1, tt_max_entries: int = TT_MAX_ENTRIES) -> None:
+        # With workers > 1, root moves after the first are searched in worker
+        # processes (young brothers wait) once the first has set alpha.
+        self.workers = workers
+        self.tt_max_entries = tt_max_entries
+        self._pool: ProcessPoolExecutor | None = None
         self.nodes = 0
         self.cutoffs = 0
         self._deadline = 0.0
         self._start = 0.0
+        # Triangular PV table: row ``ply`` holds the best line found from that
+        # ply, built by copying the child row in place on every improvement.
+        self._pv: list[list[Move | None]] = [[None] * MAX_PLY for _ in range(MAX_PLY + 1)]
+        self._pv_len = [0] * (MAX_PLY + 1)
+        # Zobrist hash -> (depth, flag, score, best move). Kept across
+        # searches so analysing related positions starts warm.
+        self.tt: dict[int, tuple[int, int, int, Move | None]] = {}
+        # Two quiet moves per ply that recently caused a beta cutoff.
+        self._killers: list[list[Move | None]] = [[None, None] for _ in range(MAX_PLY + 1)]
 
     def search(
         self,
@@ -61,9 +98,13 @@ class SearchEngine:
     ) -> SearchResult:
         if max_depth < 1:
             raise ValueError("max_depth must be >= 1")
+        if max_depth > MAX_PLY:
+            raise ValueError(f"max_depth must be <= {MAX_PLY}")
 
         self.nodes = 0
         self.cutoffs = 0
+        for killers in self._killers:
+            killers[0] = killers[1] = None
         self._start = perf_counter()
         self._deadline = self._start + (time_limit_ms / 1000.0)
 
@@ -148,7 +189,7 @@ class SearchEngine:
             score = terminal_score(board, in_check(board, board.side_to_move), 0)
             return score, None, [], [], ""
 
-        ordered = sorted(moves, key=_move_order_key, reverse=True)
+        ordered = sorted(moves, key=_ORDER_KEY, reverse=True)
 
         best_score = -100_000
         best_move: Move | None = None
@@ -156,89 +197,325 @@ class SearchEngine:
         candidates: list[CandidateScore] = []
         current_move = ""
 
-        for move in ordered:
+        pending: list[Future] | None = None
+
+        try:
+            for idx, move in enumerate(ordered):
+                self._check_timeout()
+                current_move = move.uci()
+
+                if pending is None:
+                    board.make_move(move)
+                    score = -self._negamax(board, depth - 1, -beta, -alpha, 1)
+                    board.unmake_move()
+                    child_pv = self._pv[1][: self._pv_len[1]]
+                else:
+                    score, child_pv = self._collect_root_move(pending, idx - 1)
+
+                candidates.append(CandidateScore(move=current_move, score=score, eval=round(score / 100.0, 2)))
+
+                if score > best_score:
+                    best_score = score
+                    best_move = move
+                    best_pv = [move] + child_pv
+
+                if score > alpha:
+                    alpha = score
+
+                # Young brothers wait: the remaining moves go to the workers
+                # only once the first has set alpha.
+                if idx == 0 and self.workers > 1 and depth > 1 and len(ordered) > 1:
+                    pending = self._submit_root_moves(board, ordered[1:], depth, alpha, beta)
+
+                # Snapshot fields are only assembled when the throttle will send them.
+                if not throttler.should_emit():
+                    continue
+
+                elapsed_ms = (perf_counter() - self._start) * 1000.0
+                nps = int(self.nodes / max((elapsed_ms / 1000.0), 1e-9))
+                pv_uci = [item.uci() for item in best_pv]
+                candidate_moves = {item.move: item.eval for item in sorted(candidates, key=lambda c: c.score, reverse=True)}
+
+                throttler.emit(
+                    SearchSnapshot(
+                        depth=depth,
+                        nodes=self.nodes,
+                        nps=nps,
+                        current_move=current_move,
+                        pv=pv_uci,
+                        eval=round(best_score / 100.0, 2),
+                        eval_cp=best_score,
+                        candidate_moves=candidate_moves,
+                        piece_values=root_eval.piece_values,
+                        piece_breakdown=root_eval.piece_breakdown,
+                        heatmap=_compose_heatmap(root_eval.heatmap, candidate_moves, pv_uci),
+                        cutoffs=self.cutoffs,
+                        elapsed_ms=round(elapsed_ms, 2),
+                    )
+                )
+        finally:
+            # A timeout or error leaves later root moves queued; drop them.
+            if pending is not None:
+                for future in pending:
+                    future.cancel()
+
+        candidates.sort(key=lambda item: item.score, reverse=True)
+        return best_score, best_move, best_pv, candidates, current_move
+
+    def _submit_root_moves(
+        self,
+        board: Board,
+        moves: list[Move],
+        depth: int,
+        alpha: int,
+        beta: int,
+    ) -> list[Future]:
+        if self._pool is None:
+            # Spawned rather than forked: the API runs searches on threads.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        fen = board.to_fen()
+        # Workers get an absolute wall-clock deadline: a relative budget would
+        # restart from each worker's own start-up, which spawning delays.
+        deadline = time() + (self._deadline - perf_counter())
+        return [
+            self._pool.submit(_search_root_move, fen, move, depth, alpha, beta, deadline)
+            for move in moves
+        ]
+
+    def _collect_root_move(self, pending: list[Future], idx: int) -> tuple[int, list[Move]]:
+        # Results are consumed in submission order so ties resolve exactly as
+        # in a serial search.
+        result = pending[idx].result()
+        if result is None:
+            raise _SearchTimeout
+        score, child_pv, nodes, cutoffs = result
+        self.nodes += nodes
+        self.cutoffs += cutoffs
+        return score, child_pv
+
+    def clear(self) -> None:
+        """Forget cached search state (transposition table)."""
+        self.tt.clear()
+
+    def close(self) -> None:
+        """Shut down the root-search worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def _negamax(self, board: Board, depth: int, alpha: int, beta: int, ply: int) -> int:
+        self.nodes += 1
+        if not self.nodes & TIMEOUT_CHECK_MASK:
             self._check_timeout()
-            current_move = move.uci()
+        self._pv_len[ply] = 0
 
-            board.make_move(move)
-            child_score, child_pv = self._negamax(board, depth - 1, -beta, -alpha, 1)
-            score = -child_score
+        if depth == 0:
+            return self._quiesce(board, alpha, beta)
+
+        key = board.zobrist_hash
+        tt_move: Move | None = None
+        entry = self.tt.get(key)
+        if entry is not None:
+            entry_depth, flag, entry_score, tt_move = entry
+            if entry_depth >= depth:
+                # Only cut off on scores outside the window. An exact score
+                # inside it would end the PV here, so that node is searched
+                # again, with the stored move tried first.
+                score = _score_from_tt(entry_score, ply)
+                if (flag != TT_UPPER and score >= beta) or (flag != TT_LOWER and score <= alpha):
+                    return score
+
+        alpha_orig = alpha
+        best_score = -100_000
+        best_move: Move | None = None
+        searched = 0
+        pv_row = self._pv[ply]
+        child_row = self._pv[ply + 1]
+
+        for move in self._staged_moves(board, tt_move, ply):
+            if not board.make_move(move):
+                continue
+            searched += 1
+            score = -self._negamax(board, depth - 1, -beta, -alpha, ply + 1)
             board.unmake_move()
 
-            candidates.append(CandidateScore(move=current_move, score=score, eval=round(score / 100.0, 2)))
-
             if score > best_score:
                 best_score = score
                 best_move = move
-                best_pv = [move] + child_pv
+                child_len = self._pv_len[ply + 1]
+                pv_row[0] = move
+                pv_row[1 : child_len + 1] = child_row[:child_len]
+                self._pv_len[ply] = child_len + 1
 
             if score > alpha:
                 alpha = score
 
-            elapsed_ms = (perf_counter() - self._start) * 1000.0
-            nps = int(self.nodes / max((elapsed_ms / 1000.0), 1e-9))
-            pv_uci = [item.uci() for item in best_pv]
-            candidate_moves = {item.move: item.eval for item in sorted(candidates, key=lambda c: c.score, reverse=True)}
-
-            throttler.emit(
-                SearchSnapshot(
-                    depth=depth,
-                    nodes=self.nodes,
-                    nps=nps,
-                    current_move=current_move,
-                    pv=pv_uci,
-                    eval=round(best_score / 100.0, 2),
-                    eval_cp=best_score,
-                    candidate_moves=candidate_moves,
-                    piece_values=root_eval.piece_values,
-                    piece_breakdown=root_eval.piece_breakdown,
-                    heatmap=_compose_heatmap(root_eval.heatmap, candidate_moves, pv_uci),
-                    cutoffs=self.cutoffs,
-                    elapsed_ms=round(elapsed_ms, 2),
-                )
-            )
-
-        candidates.sort(key=lambda item: item.score, reverse=True)
-        return best_score, best_move, best_pv, candidates, current_move
+            if alpha >= beta:
+                self.cutoffs += 1
+                if move.captured == PIECE_NONE and move.promotion == PIECE_NONE and not move.is_en_passant:
+                    killers = self._killers[ply]
+                    if killers[0] is not move:
+                        killers[1] = killers[0]
+                        killers[0] = move
+                break
 
-    def _negamax(self, board: Board, depth: int, alpha: int, beta: int, ply: int) -> tuple[int, list[Move]]:
-        self._check_timeout()
+        if searched == 0:
+            return terminal_score(board, in_check(board, board.side_to_move), ply)
+
+        if best_score <= alpha_orig:
+            flag = TT_UPPER
+        elif best_score >= beta:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        # Only a new key grows the table; overwriting one never needs a flush.
+        if key not in self.tt and len(self.tt) >= self.tt_max_entries:
+            self.tt.clear()
+        self.tt[key] = (depth, flag, _score_to_tt(best_score, ply), best_move)
+        return best_score
+
+    def _staged_moves(self, board: Board, tt_move: Move | None, ply: int) -> Iterator[Move]:
+        """Yield the TT move, captures by MVV-LVA, killers, then the other quiets.
+
+        Each stage is generated only when it is reached, so a cutoff on a
+        capture never pays for quiet generation. The TT move needs only its own
+        stage generated first.
+        """
+        captures: list[Move] | None = None
+        quiets: list[Move] | None = None
+        if tt_move is not None:
+            # The table is keyed by a 64-bit hash, so a colliding entry can hold
+            # a move from another position. The stored move is tried only if its
+            # stage's legal list here contains it; only that stage is generated
+            # before it, so a cutoff still skips the other stage.
+            if tt_move.captured != PIECE_NONE or tt_move.promotion != PIECE_NONE or tt_move.is_en_passant:
+                captures = generate_captures(board)
+                stage = captures
+            else:
+                quiets = generate_quiets(board)
+                stage = quiets
+            if tt_move in stage:
+                yield tt_move
+            else:
+                tt_move = None
+
+        if captures is None:
+            captures = generate_captures(board)
+        scores = [_mvv_lva(move) for move in captures]
+        for idx in range(len(captures)):
+            move = _pick_next_move(captures, scores, idx)
+            if move is not tt_move:
+                yield move
+
+        if quiets is None:
+            quiets = generate_quiets(board)
+        scores = [move.order_key for move in quiets]
+        for killer in self._killers[ply]:
+            if killer is not None and killer in quiets:
+                scores[quiets.index(killer)] = KILLER_ORDER
+        for idx in range(len(quiets)):
+            move = _pick_next_move(quiets, scores, idx)
+            if move is not tt_move:
+                yield move
+
+    def _quiesce(self, board: Board, alpha: int, beta: int) -> int:
+        """Resolve captures past the horizon so leaf scores are tactically quiet."""
         self.nodes += 1
+        if not self.nodes & TIMEOUT_CHECK_MASK:
+            self._check_timeout()
 
-        if depth == 0:
-            return evaluate(board), []
-
-        moves = generate_legal_moves(board)
-        if not moves:
-            return terminal_score(board, in_check(board, board.side_to_move), ply), []
-
-        best_score = -100_000
-        best_line: list[Move] = []
+        # Standing pat assumes some quiet move holds the static score; checks
+        # are not extended, which keeps the capture tree small.
+        stand_pat = evaluate(board)
+        if stand_pat >= beta:
+            return stand_pat
+        if stand_pat > alpha:
+            alpha = stand_pat
+        best_score = stand_pat
+
+        moves = generate_captures(board)
+        scores = [_mvv_lva(move) for move in moves]
+        for idx in range(len(moves)):
+            move = _pick_next_move(moves, scores, idx)
+            if stand_pat + _material_gain(move) + DELTA_MARGIN <= alpha:
+                # Picked in falling gain order, so no later capture can do better.
+                break
 
-        for move in sorted(moves, key=_move_order_key, reverse=True):
             board.make_move(move)
-            child_score, child_line = self._negamax(board, depth - 1, -beta, -alpha, ply + 1)
-            score = -child_score
+            score = -self._quiesce(board, -beta, -alpha)
             board.unmake_move()
 
             if score > best_score:
                 best_score = score
-                best_line = [move] + child_line
-
             if score > alpha:
                 alpha = score
-
             if alpha >= beta:
                 self.cutoffs += 1
                 break
 
-        return best_score, best_line
+        return best_score
 
     def _check_timeout(self) -> None:
         if perf_counter() >= self._deadline:
             raise _SearchTimeout
 
 
+def _material_gain(move: Move) -> int:
+    gain = PIECE_VALUES[WP] if move.is_en_passant else 0
+    if move.captured != PIECE_NONE:
+        gain = PIECE_VALUES[move.captured % 6]
+    if move.promotion != PIECE_NONE:
+        gain += PIECE_VALUES[move.promotion % 6] - PIECE_VALUES[WP]
+    return gain
+
+
+def _mvv_lva(move: Move) -> int:
+    # Most valuable victim first, least valuable attacker breaking ties.
+    return _material_gain(move) * 16 - PIECE_VALUES[move.piece % 6] // 10
+
+
+def _score_to_tt(score: int, ply: int) -> int:
+    if score > MATE_THRESHOLD:
+        return score + ply
+    if score < -MATE_THRESHOLD:
+        return score - ply
+    return score
+
+
+def _score_from_tt(score: int, ply: int) -> int:
+    if score > MATE_THRESHOLD:
+        return score - ply
+    if score < -MATE_THRESHOLD:
+        return score + ply
+    return score
+
+
+def _search_root_move(
+    fen: str,
+    move: Move,
+    depth: int,
+    alpha: int,
+    beta: int,
+    deadline: float,
+) -> tuple[int, list[Move], int, int] | None:
+    """Worker-process search of one root move; None if it ran out of time.
+
+    ``deadline`` is a ``time.time()`` timestamp shared with the parent search.
+    """
+    board = Board(fen)
+    board.make_move(move)
+    engine = SearchEngine()
+    engine._deadline = perf_counter() + (deadline - time())
+    try:
+        score = -engine._negamax(board, depth - 1, -beta, -alpha, 1)
+    except _SearchTimeout:
+        return None
+    return score, engine._pv[1][: engine._pv_len[1]], engine.nodes, engine.cutoffs
+
+
 def _to_snapshot(result: SearchResult) -> SearchSnapshot:
     return SearchSnapshot(
         depth=result.depth,
@@ -257,25 +534,23 @@ def _to_snapshot(result: SearchResult) -> SearchSnapshot:
     )
 
 
-def _build_heatmap(candidate_moves: dict[str, float], pv: list[str]) -> dict[str, int]:
-    heatmap: dict[str, int] = {}
+def _build_heatmap(candidate_moves: dict[str, float], pv: list[str]) -> list[int]:
+    """Search heat per square index from the PV and the top-ranked candidates."""
+    heat = [0] * 64
 
     for idx, move in enumerate(pv[:8]):
         if len(move) < 4:
             continue
-        to_sq = move[2:4]
-        heatmap[to_sq] = heatmap.get(to_sq, 0) + max(1, 5 - idx)
+        heat[SQUARE_TO_INDEX[move[2:4]]] += max(1, 5 - idx)
 
     ranked = sorted(candidate_moves.items(), key=lambda item: item[1], reverse=True)
     for idx, (move, _) in enumerate(ranked[:10]):
         if len(move) < 4:
             continue
-        from_sq = move[:2]
-        to_sq = move[2:4]
-        heatmap[from_sq] = heatmap.get(from_sq, 0) + max(1, 3 - idx)
-        heatmap[to_sq] = heatmap.get(to_sq, 0) + max(1, 4 - idx)
+        heat[SQUARE_TO_INDEX[move[:2]]] += max(1, 3 - idx)
+        heat[SQUARE_TO_INDEX[move[2:4]]] += max(1, 4 - idx)
 
-    return heatmap
+    return heat
 
 
 def _compose_heatmap(
@@ -284,18 +559,23 @@ def _compose_heatmap(
     pv: list[str],
 ) -> dict[str, int]:
     merged = dict(static_heatmap)
-    search_heatmap = _build_heatmap(candidate_moves, pv)
-    for square, value in search_heatmap.items():
-        merged[square] = merged.get(square, 0) + value
+    for sq, value in enumerate(_build_heatmap(candidate_moves, pv)):
+        if value:
+            square = SQUARES[sq]
+            merged[square] = merged.get(square, 0) + value
     return merged
 
 
-def _move_order_key(move: Move) -> int:
-    score = 0
-    if move.captured != -1:
-        score += 10_000
-    if move.promotion != -1:
-        score += 8_000
-    if move.is_castle:
-        score += 100
-    return score
+def _pick_next_move(moves: list[Move], scores: list[int], start: int) -> Move:
+    """Bring the best-scored move from ``moves[start:]`` to ``start`` and return it.
+
+    Moves are ordered lazily so a cutoff skips ordering the tail. The first of
+    equal scores is picked and the rest keep their relative order, matching a
+    stable descending sort.
+    """
+    best_score = max(scores[start:])
+    best = scores.index(best_score, start)
+    if best != start:
+        moves.insert(start, moves.pop(best))
+        scores.insert(start, scores.pop(best))
+    return moves[start]
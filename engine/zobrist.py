@@ -0,0 +1,16 @@
+"""Zobrist keys for incremental position hashing."""
+
+from __future__ import annotations
+
+import random
+
+# Fixed seed: hashes are stable across runs and processes, so transposition
+# entries can be compared between worker processes and test runs.
+_rng = random.Random(0x4A414E5553)
+
+PIECE_KEYS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(_rng.getrandbits(64) for _ in range(64)) for _ in range(12)
+)
+SIDE_KEY = _rng.getrandbits(64)
+CASTLING_KEYS: tuple[int, ...] = tuple(_rng.getrandbits(64) for _ in range(16))
+EP_FILE_KEYS: tuple[int, ...] = tuple(_rng.getrandbits(64) for _ in range(8))
@@ -65,6 +65,9 @@ const EMPTY_SEARCH = {
   heatmap: {}
 };
 
+// Per-square maps the server sends as deltas after the first snapshot of a search.
+const SNAPSHOT_DIFF_FIELDS = ["piece_values", "piece_breakdown", "heatmap"];
+
 function sideLabel(side) {
   return side === "w" ? "White" : "Black";
 }
@@ -574,11 +577,27 @@ export default function App() {
         );
       };
 
-      socket.onmessage = async (event) => {
-        if (token !== searchTokenRef.current) return;
+      let snapshotMaps = null;
+      const applySnapshotDiff = (data) => {
+        if (!data.diff || !snapshotMaps) {
+          snapshotMaps = Object.fromEntries(SNAPSHOT_DIFF_FIELDS.map((field) => [field, data[field] || {}]));
+          return data;
+        }
+        const merged = { ...data };
+        for (const field of SNAPSHOT_DIFF_FIELDS) {
+          const delta = data.diff[field];
+          if (delta) {
+            const next = { ...snapshotMaps[field], ...delta.changed };
+            for (const key of delta.removed) delete next[key];
+            snapshotMaps[field] = next;
+          }
+          merged[field] = snapshotMaps[field];
+        }
+        delete merged.diff;
+        return merged;
+      };
 
-        const data = JSON.parse(event.data);
-        armWatchdog();
+      const handleSearchMessage = async (data) => {
         if (data.type === "snapshot") {
           const now = Date.now();
           if (now - lastSnapshotUiUpdateRef.current < 120) {
@@ -624,6 +643,30 @@ export default function App() {
         }
       };
 
+      socket.onmessage = async (event) => {
+        if (token !== searchTokenRef.current) return;
+
+        const parsed = JSON.parse(event.data);
+        armWatchdog();
+        // The server coalesces bursts into one array frame; within a burst only
+        // the newest snapshot is worth rendering.
+        // Snapshot deltas are relative to the previous snapshot, so every one is
+        // applied, even those that are not rendered.
+        const messages = (Array.isArray(parsed) ? parsed : [parsed]).map((message) =>
+          message.type === "snapshot" ? applySnapshotDiff(message) : message
+        );
+        let lastSnapshotIndex = -1;
+        messages.forEach((message, index) => {
+          if (message.type === "snapshot") lastSnapshotIndex = index;
+        });
+        for (let index = 0; index < messages.length; index += 1) {
+          const message = messages[index];
+          if (message.type === "snapshot" && index !== lastSnapshotIndex) continue;
+          await handleSearchMessage(message);
+          if (token !== searchTokenRef.current) return;
+        }
+      };
+
       socket.onerror = () => {
         if (token !== searchTokenRef.current) return;
         if (!fallbackStarted) {
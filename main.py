@@ -3,13 +3,24 @@
 from __future__ import annotations
 
 import argparse
+import os
+import sys
+from typing import TYPE_CHECKING, Callable
 
 from engine.board import Board
 from engine.constants import BLACK, START_FEN, WHITE
-from engine.evaluation import evaluate
-from engine.perft import perft, perft_divide
-from engine.search import SearchEngine
-from engine.movegen import generate_legal_moves, in_check
+
+# Movegen, evaluation and search are imported where they are used: building
+# their attack tables dominates start-up, and each subcommand needs only some.
+if TYPE_CHECKING:
+    from engine.move import Move
+    from engine.search import SearchEngine
+
+DIVIDE_FLUSH_LINES = 8
+PARALLEL_DIVIDE_DEPTH = 5
+_QUIT_COMMANDS = frozenset({"quit", "exit"})
+_SIDE_MAP = {"white": WHITE, "black": BLACK}
+_SIDE_NAMES = ("white", "black")
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -31,26 +42,24 @@ def build_parser() -> argparse.ArgumentParser:
     eval_parser.add_argument("--time", type=int, default=2000, help="Time limit in ms")
 
     play_parser = subparsers.add_parser("play", help="Play against the engine in terminal")
-    play_parser.add_argument("--side", choices=("white", "black"), default="white", help="Your side")
+    play_parser.add_argument("--side", choices=tuple(_SIDE_MAP), default="white", help="Your side")
     play_parser.add_argument("--depth", type=int, default=4, help="Engine max depth")
     play_parser.add_argument("--time", type=int, default=2000, help="Engine time limit in ms")
 
     return parser
 
 
-def _find_legal_move(board: Board, move_uci: str):
-    for move in generate_legal_moves(board):
-        if move.uci() == move_uci:
-            return move
-    return None
+def _find_legal_move(legal_by_uci: dict[str, Move], move_uci: str) -> Move | None:
+    return legal_by_uci.get(move_uci)
+
 
+def _print_eval(board: Board, engine: SearchEngine, depth: int, time_ms: int) -> None:
+    from engine.evaluation import evaluate
 
-def _print_eval(board: Board, depth: int, time_ms: int) -> None:
     static_cp = evaluate(board)
-    engine = SearchEngine()
     result = engine.search(board, max_depth=depth, time_limit_ms=time_ms)
     best = result.best_move.uci() if result.best_move else "0000"
-    pv = " ".join(m.uci() for m in result.pv) or "-"
+    pv = " ".join([m.uci() for m in result.pv]) or "-"
     print(f"static_eval_cp={static_cp}")
     print(
         f"search_eval_cp={result.score} depth={result.depth} "
@@ -60,53 +69,78 @@ def _print_eval(board: Board, depth: int, time_ms: int) -> None:
 
 
 def _run_play_mode(board: Board, human_side: int, depth: int, time_ms: int) -> None:
-    print("Commands: move in UCI (e2e4), eval, fen, moves, quit")
+    from engine.movegen import generate_legal_moves, in_check
+    from engine.search import SearchEngine
+
+    # One engine for the whole game so its transposition table carries over
+    # between turns; it is only cleared when the user starts a new game.
+    engine = SearchEngine()
+    initial_fen = board.to_fen()
+
+    def new_game() -> None:
+        board.set_fen(initial_fen)
+        engine.clear()
+
+    # Built once per session; the handlers read the current turn's cached
+    # fen/legal_by_uci through their closures.
+    commands: dict[str, Callable[[], None]] = {
+        "fen": lambda: print(fen),
+        "moves": lambda: print(" ".join(legal_by_uci)),
+        "eval": lambda: _print_eval(board, engine, depth, time_ms),
+        "new": new_game,
+    }
+    print("Commands: move in UCI (e2e4), eval, fen, moves, new, quit")
+    # Blank input, queries and illegal moves loop back without changing the
+    # position, so the per-position renders are reused until a move is made.
+    cached_key = None
     while True:
-        legal = generate_legal_moves(board)
+        key = (board.zobrist_hash, board.halfmove_clock, board.fullmove_number)
+        if key != cached_key:
+            cached_key = key
+            legal = generate_legal_moves(board)
+            legal_by_uci = {m.uci(): m for m in legal}
+            board_str = str(board)
+            fen = board.to_fen()
+
+        side = board.side_to_move
+        stm = _SIDE_NAMES[side]
         if not legal:
-            if in_check(board, board.side_to_move):
-                winner = "black" if board.side_to_move == WHITE else "white"
+            if in_check(board, side):
+                winner = _SIDE_NAMES[side ^ 1]
                 print(f"Checkmate. {winner} wins.")
             else:
                 print("Stalemate.")
             return
 
         print()
-        print(board)
-        print(f"FEN: {board.to_fen()}")
-        stm = "white" if board.side_to_move == WHITE else "black"
+        print(board_str)
+        print(f"FEN: {fen}")
         print(f"Side to move: {stm}")
 
-        if board.side_to_move == human_side:
+        if side == human_side:
             raw = input("your> ").strip().lower()
             if not raw:
                 continue
-            if raw in {"quit", "exit"}:
+            if raw in _QUIT_COMMANDS:
                 return
-            if raw == "fen":
-                print(board.to_fen())
-                continue
-            if raw == "moves":
-                print(" ".join(m.uci() for m in legal))
-                continue
-            if raw == "eval":
-                _print_eval(board, depth, time_ms)
+            handler = commands.get(raw)
+            if handler is not None:
+                handler()
                 continue
 
-            move = _find_legal_move(board, raw)
+            move = _find_legal_move(legal_by_uci, raw)
             if move is None:
                 print("Illegal move. Use `moves` to list legal options.")
                 continue
             board.make_move(move)
             continue
 
-        engine = SearchEngine()
         result = engine.search(board, max_depth=depth, time_limit_ms=time_ms)
         if result.best_move is None:
             print("No move found.")
             return
         board.make_move(result.best_move)
-        pv = " ".join(m.uci() for m in result.pv) or "-"
+        pv = " ".join([m.uci() for m in result.pv]) or "-"
         print(
             f"engine> {result.best_move.uci()} "
             f"(eval={result.score} depth={result.depth} nodes={result.nodes})"
@@ -114,34 +148,81 @@ def _run_play_mode(board: Board, human_side: int, depth: int, time_ms: int) -> N
         print(f"pv {pv}")
 
 
-def run() -> None:
-    parser = build_parser()
-    args = parser.parse_args()
+def _available_cpus() -> int:
+    # The affinity mask reflects CPU pinning (taskset, container cpusets);
+    # os.cpu_count() reports every CPU on the host.
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _write_divide(board: Board, depth: int) -> None:
+    from engine.perft import perft_divide_iter
+
+    # Lines are written in batches: one write per DIVIDE_FLUSH_LINES root moves
+    # keeps progress visible on long runs without a print call per move.
+    out = sys.stdout
+    # Shallow divides finish faster than a process pool can start.
+    workers = _available_cpus() if depth >= PARALLEL_DIVIDE_DEPTH else 1
+    pending: list[str] = []
+    for move, count in perft_divide_iter(board, depth, workers):
+        pending.append(f"{move}: {count}\n")
+        if len(pending) >= DIVIDE_FLUSH_LINES:
+            out.write("".join(pending))
+            out.flush()
+            pending.clear()
+    out.write("".join(pending))
+
+
+def _parse_fast(argv: list[str]) -> argparse.Namespace | None:
+    """Parse ``perft <depth> [--divide]`` without building the full parser."""
+    if len(argv) not in (2, 3) or argv[0] != "perft":
+        return None
+    if len(argv) == 3 and argv[2] != "--divide":
+        return None
+    try:
+        depth = int(argv[1])
+    except ValueError:
+        return None
+    return argparse.Namespace(fen=START_FEN, command="perft", depth=depth, divide=len(argv) == 3)
+
+
+def run(argv: list[str] | None = None) -> None:
+    if argv is None:
+        argv = sys.argv[1:]
+    args = _parse_fast(argv)
+    if args is None:
+        args = build_parser().parse_args(argv)
 
     board = Board(args.fen)
 
     if args.command == "perft":
         if args.divide:
-            for move, count in perft_divide(board, args.depth).items():
-                print(f"{move}: {count}")
+            _write_divide(board, args.depth)
         else:
+            from engine.perft import perft
+
             print(perft(board, args.depth))
         return
 
     if args.command == "search":
+        from engine.search import SearchEngine
+
         engine = SearchEngine()
         result = engine.search(board, max_depth=args.depth, time_limit_ms=args.time)
         print(f"bestmove {result.best_move.uci() if result.best_move else '0000'}")
         print(f"depth {result.depth} score {result.score} nodes {result.nodes} nps {result.nps}")
-        print("pv", " ".join(m.uci() for m in result.pv))
+        print("pv", " ".join([m.uci() for m in result.pv]))
         return
 
     if args.command == "eval":
-        _print_eval(board, args.depth, args.time)
+        from engine.search import SearchEngine
+
+        _print_eval(board, SearchEngine(), args.depth, args.time)
         return
 
     if args.command == "play":
-        human_side = WHITE if args.side == "white" else BLACK
+        human_side = _SIDE_MAP[args.side]
         _run_play_mode(board, human_side, args.depth, args.time)
         return
 
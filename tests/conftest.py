@@ -0,0 +1,52 @@
+from typing import Callable
+
+import pytest
+
+from engine.board import Board
+from engine.instrumentation import SearchSnapshot
+from engine.search import SearchEngine
+
+AFTER_E4_FEN = "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"
+
+
+@pytest.fixture(scope="module")
+def _after_e4_position() -> Board:
+    return Board(AFTER_E4_FEN)
+
+
+@pytest.fixture
+def after_e4_board(_after_e4_position: Board) -> Board:
+    # Parsed once per module; each test gets its own copy to mutate.
+    return _after_e4_position.copy()
+
+
+@pytest.fixture(scope="session")
+def engine() -> SearchEngine:
+    # Shared across tests; callers clear() it so no TT entries leak between them.
+    return SearchEngine()
+
+
+@pytest.fixture
+def make_snapshot() -> Callable[..., SearchSnapshot]:
+    """Factory for SearchSnapshot instances; keyword arguments override fields."""
+
+    def factory(**fields) -> SearchSnapshot:
+        values = {
+            "depth": 1,
+            "nodes": 10,
+            "nps": 100,
+            "current_move": "e2e4",
+            "pv": ["e2e4"],
+            "eval": 0.2,
+            "eval_cp": 20,
+            "candidate_moves": {"e2e4": 0.2},
+            "piece_values": {"e2": 100},
+            "piece_breakdown": {},
+            "heatmap": {},
+            "cutoffs": 0,
+            "elapsed_ms": 1.0,
+        }
+        values.update(fields)
+        return SearchSnapshot(**values)
+
+    return factory
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+from typing import Callable
+
+import orjson
 from fastapi.testclient import TestClient
 
 from api.server import app
+from api.websocket import _SnapshotChannel, _merge_batch
 from engine.constants import START_FEN
+from engine.instrumentation import SearchSnapshot, SnapshotDiffer
 
 
 client = TestClient(app)
@@ -42,3 +47,117 @@ def test_analyze_contains_position_eval_and_best_move() -> None:
     assert "position_eval_cp" in body
     assert body["depth"] >= 1
     assert isinstance(body["best_move"], str) or body["best_move"] is None
+
+
+def test_search_websocket_streams_snapshots_then_complete() -> None:
+    with client.websocket_connect("/ws/search") as ws:
+        ws.send_json({"fen": START_FEN, "max_depth": 2, "time_limit_ms": 1000, "snapshot_interval_ms": 1})
+        messages = []
+        while not messages or messages[-1]["type"] not in ("complete", "error"):
+            frame = ws.receive_json()
+            messages.extend(frame if isinstance(frame, list) else [frame])
+
+    assert messages[-1]["type"] == "complete"
+    assert isinstance(messages[-1]["best_move"], str)
+    snapshots = [item for item in messages if item["type"] == "snapshot"]
+    assert snapshots
+    assert {"depth", "nodes", "pv", "heatmap", "piece_values"}.issubset(snapshots[0].keys())
+
+
+def test_search_websocket_handles_successive_requests() -> None:
+    with client.websocket_connect("/ws/search") as ws:
+        for _ in range(2):
+            ws.send_json({"fen": START_FEN, "max_depth": 1, "time_limit_ms": 1000})
+            messages = []
+            while not messages or messages[-1]["type"] not in ("complete", "error"):
+                frame = ws.receive_json()
+                messages.extend(frame if isinstance(frame, list) else [frame])
+            assert messages[-1]["type"] == "complete"
+            assert messages[-1]["nodes"] > 0
+
+
+def test_search_websocket_repeated_fen_keeps_full_pv() -> None:
+    fen = "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"
+    completes = []
+    with client.websocket_connect("/ws/search") as ws:
+        for _ in range(2):
+            ws.send_json({"fen": fen, "max_depth": 3, "time_limit_ms": 60_000})
+            messages = []
+            while not messages or messages[-1]["type"] not in ("complete", "error"):
+                frame = ws.receive_json()
+                messages.extend(frame if isinstance(frame, list) else [frame])
+            completes.append(messages[-1])
+
+    first, repeat = completes
+    assert first["type"] == repeat["type"] == "complete"
+    assert len(first["pv"]) == 3
+    assert repeat["pv"] == first["pv"]
+
+
+def test_merge_batch_keeps_newest_snapshot_per_depth(make_snapshot: Callable[..., SearchSnapshot]) -> None:
+    assert _merge_batch(['{"type":"complete"}'], SnapshotDiffer()) == '{"type":"complete"}'
+
+    merged = orjson.loads(
+        _merge_batch(
+            [
+                make_snapshot(depth=1, nodes=10),
+                make_snapshot(depth=1, nodes=20),
+                make_snapshot(depth=2, nodes=30),
+                '{"type":"complete"}',
+            ],
+            SnapshotDiffer(),
+        )
+    )
+    assert [item["type"] for item in merged] == ["snapshot", "snapshot", "complete"]
+    assert [item.get("nodes") for item in merged] == [20, 30, None]
+
+
+def test_websocket_bounded_snapshot_queue_still_completes() -> None:
+    with client.websocket_connect("/ws/search") as ws:
+        ws.send_json(
+            {
+                "fen": START_FEN,
+                "max_depth": 2,
+                "time_limit_ms": 1000,
+                "snapshot_interval_ms": 1,
+                "snapshot_max_queue": 1,
+            }
+        )
+        messages = []
+        while not messages or messages[-1]["type"] not in ("complete", "error"):
+            frame = ws.receive_json()
+            messages.extend(frame if isinstance(frame, list) else [frame])
+
+    assert messages[-1]["type"] == "complete"
+    assert isinstance(messages[-1]["best_move"], str)
+
+
+def test_websocket_rejects_negative_snapshot_queue_bound() -> None:
+    with client.websocket_connect("/ws/search") as ws:
+        ws.send_json({"fen": START_FEN, "max_depth": 1, "snapshot_max_queue": -1})
+        error = ws.receive_json()
+        assert error["type"] == "error"
+        assert "snapshot_max_queue" in error["message"]
+
+        # The connection stays usable after the rejected request.
+        ws.send_json({"fen": START_FEN, "max_depth": 1, "time_limit_ms": 1000})
+        messages = []
+        while not messages or messages[-1]["type"] not in ("complete", "error"):
+            frame = ws.receive_json()
+            messages.extend(frame if isinstance(frame, list) else [frame])
+        assert messages[-1]["type"] == "complete"
+
+
+def test_snapshot_channel_drops_oldest_snapshots_for_slow_consumer(
+    make_snapshot: Callable[..., SearchSnapshot],
+) -> None:
+    channel = _SnapshotChannel(max_queue=2)
+    snapshots = [make_snapshot(nodes=nodes) for nodes in range(5)]
+    for snapshot in snapshots:
+        channel.push(snapshot)
+    channel.finish('{"type":"complete"}')
+
+    batch, finished = channel.drain()
+
+    assert finished
+    assert batch == [snapshots[3], snapshots[4], '{"type":"complete"}']
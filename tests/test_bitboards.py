@@ -1,4 +1,4 @@
-from engine.bitboards import clear_bit, get_bit, pop_lsb, set_bit
+from engine.bitboards import ADJACENT_FILE_MASKS, FILE_MASKS, clear_bit, get_bit, iter_bits, pop_lsb, set_bit
 
 
 def test_set_get_clear_bit() -> None:
@@ -26,3 +26,21 @@ def test_pop_lsb_order() -> None:
         popped.append(sq)
 
     assert popped == [2, 5, 11]
+
+
+def test_iter_bits_matches_pop_lsb_order() -> None:
+    bb = 0
+    for sq in (0, 9, 36, 63):
+        bb = set_bit(bb, sq)
+
+    assert list(iter_bits(bb)) == [0, 9, 36, 63]
+    assert list(iter_bits(0)) == []
+
+
+def test_file_masks_cover_each_file() -> None:
+    assert FILE_MASKS[0] & (1 << 0)
+    assert FILE_MASKS[0] & (1 << 56)
+    assert FILE_MASKS[7] & (1 << 63)
+    assert all(mask.bit_count() == 8 for mask in FILE_MASKS)
+    assert ADJACENT_FILE_MASKS[0] == FILE_MASKS[1]
+    assert ADJACENT_FILE_MASKS[4] == FILE_MASKS[3] | FILE_MASKS[5]
@@ -8,6 +8,7 @@ from engine.constants import (
     square_index,
 )
 from engine.move import Move
+from engine.movegen import generate_legal_moves
 
 
 def snapshot(board: Board):
@@ -113,3 +114,56 @@ def test_reject_invalid_en_passant_target() -> None:
     )
     assert not board.make_move(move)
     assert snapshot(board) == initial
+
+
+def test_incremental_occupancies_match_piece_bitboards() -> None:
+    def expected(b: Board) -> tuple[int, int, int]:
+        white = 0
+        black = 0
+        for piece, bb in enumerate(b.piece_bitboards):
+            if piece < 6:
+                white |= bb
+            else:
+                black |= bb
+        return white, black, white | black
+
+    board = Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    initial = snapshot(board)
+    for move in generate_legal_moves(board):
+        assert board.make_move(move)
+        assert tuple(board.occupancies) == expected(board)
+        for reply in generate_legal_moves(board):
+            assert board.make_move(reply)
+            assert tuple(board.occupancies) == expected(board)
+            assert board.unmake_move()
+        assert board.unmake_move()
+    assert snapshot(board) == initial
+
+
+def test_zobrist_hash_is_incremental_and_transposition_invariant() -> None:
+    board = Board()
+    start_hash = board.zobrist_hash
+
+    for uci in ("g1f3", "g8f6", "f3g1", "f6g8"):
+        move = next(m for m in generate_legal_moves(board) if m.uci() == uci)
+        assert board.make_move(move)
+        assert board.zobrist_hash == Board(board.to_fen()).zobrist_hash
+
+    assert board.zobrist_hash == start_hash
+    for _ in range(4):
+        assert board.unmake_move()
+    assert board.zobrist_hash == start_hash
+
+
+def test_copy_is_independent_of_the_original() -> None:
+    board = Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    board.make_move(generate_legal_moves(board)[0])
+    initial = snapshot(board)
+
+    clone = board.copy()
+    assert snapshot(clone) == initial
+
+    clone.make_move(generate_legal_moves(clone)[0])
+    assert snapshot(board) == initial
+    assert clone.unmake_move() and clone.unmake_move()
+    assert snapshot(board) == initial
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import pytest
+
+from engine.board import Board
+from engine.constants import WHITE
+from main import _run_play_mode
+
+
+def test_play_mode_repeated_eval_reports_the_same_pv(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    commands = iter(["eval", "eval", "quit"])
+    monkeypatch.setattr("builtins.input", lambda _prompt: next(commands))
+
+    _run_play_mode(Board(), WHITE, depth=3, time_ms=60_000)
+
+    pv_lines = [line for line in capsys.readouterr().out.splitlines() if line.startswith("pv ")]
+    assert len(pv_lines) == 2
+    assert len(pv_lines[0].split()) == 4
+    assert pv_lines[1] == pv_lines[0]
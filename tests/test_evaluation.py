@@ -1,5 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from engine import evaluation
 from engine.board import Board
-from engine.evaluation import evaluate, evaluate_detailed
+from engine.constants import BK, BP, WK, WP
+from engine.evaluation import MIRROR, PST_BY_PIECE, evaluate, evaluate_detailed
+from engine.movegen import generate_legal_moves
 
 
 def test_evaluate_returns_centipawns_int() -> None:
@@ -8,9 +15,8 @@ def test_evaluate_returns_centipawns_int() -> None:
     assert isinstance(score, int)
 
 
-def test_evaluate_detailed_exposes_breakdown_maps() -> None:
-    board = Board("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1")
-    details = evaluate_detailed(board)
+def test_evaluate_detailed_exposes_breakdown_maps(after_e4_board: Board) -> None:
+    details = evaluate_detailed(after_e4_board)
 
     assert isinstance(details.score_cp, int)
     assert "white" in details.components
@@ -22,3 +28,54 @@ def test_evaluate_detailed_exposes_breakdown_maps() -> None:
     piece_info = details.piece_breakdown.get("e4")
     assert piece_info is not None
     assert {"base", "pst", "mobility", "pawn_structure", "king_safety", "total"}.issubset(piece_info.keys())
+
+
+def test_fast_evaluate_matches_detailed_score() -> None:
+    fens = (
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+        "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 b - - 0 1",
+        "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 b - - 0 10",
+    )
+    for fen in fens:
+        board = Board(fen)
+        assert evaluate(board) == evaluate_detailed(board).score_cp
+
+
+def test_black_pst_tables_are_premirrored() -> None:
+    for white_piece, black_piece in ((WP, BP), (WK, BK)):
+        for sq in range(64):
+            assert PST_BY_PIECE[black_piece][sq] == PST_BY_PIECE[white_piece][MIRROR[sq]]
+
+
+def test_evaluate_detailed_is_cached_by_position() -> None:
+    board = Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    first = evaluate_detailed(board)
+    assert evaluate_detailed(board.copy()) is first
+
+    board.make_move(generate_legal_moves(board)[0])
+    moved = evaluate_detailed(board)
+    assert moved is not first
+    assert moved.score_cp == evaluate(board)
+
+    board.unmake_move()
+    assert evaluate_detailed(board) is first
+
+
+def test_evaluate_detailed_cache_survives_concurrent_eviction(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(evaluation, "DETAIL_CACHE_SIZE", 2)
+    root = Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    boards = []
+    for move in generate_legal_moves(root)[:8]:
+        child = root.copy()
+        child.make_move(move)
+        boards.append(child)
+
+    def churn() -> None:
+        for _ in range(25):
+            for board in boards:
+                evaluate_detailed(board)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        for future in [pool.submit(churn) for _ in range(4)]:
+            future.result()
@@ -0,0 +1,27 @@
+from engine.constants import square_index
+from engine.magic import bishop_attacks, queen_attacks, rook_attacks
+
+
+def _mask(*squares: str) -> int:
+    bb = 0
+    for sq in squares:
+        bb |= 1 << square_index(sq)
+    return bb
+
+
+def test_slider_attacks_on_empty_board() -> None:
+    assert rook_attacks(square_index("a1"), 0).bit_count() == 14
+    assert bishop_attacks(square_index("d4"), 0).bit_count() == 13
+    assert queen_attacks(square_index("d4"), 0).bit_count() == 27
+
+
+def test_slider_attacks_stop_at_first_blocker() -> None:
+    occupancy = _mask("d6", "f4", "b2")
+
+    rook = rook_attacks(square_index("d4"), occupancy)
+    assert rook & _mask("d5", "d6", "e4", "f4")
+    assert not rook & _mask("d7", "g4")
+
+    bishop = bishop_attacks(square_index("d4"), occupancy)
+    assert bishop & _mask("c3", "b2")
+    assert not bishop & _mask("a1")
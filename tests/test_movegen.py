@@ -1,5 +1,10 @@
 from engine.board import Board
-from engine.movegen import generate_legal_moves
+from engine.movegen import (
+    attacked_squares,
+    compute_checkers_and_pins,
+    generate_legal_moves,
+    is_square_attacked,
+)
 
 
 def _moves_uci(board: Board) -> set[str]:
@@ -46,3 +51,31 @@ def test_promotion_moves_generated() -> None:
     board = Board("k7/4P3/8/8/8/8/8/4K3 w - - 0 1")
     moves = _moves_uci(board)
     assert {"e7e8q", "e7e8r", "e7e8b", "e7e8n"}.issubset(moves)
+
+
+def test_attacked_squares_matches_per_square_attack_test() -> None:
+    board = Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    for side in (0, 1):
+        expected = 0
+        for sq in range(64):
+            if is_square_attacked(board, sq, side):
+                expected |= 1 << sq
+        assert attacked_squares(board, side) == expected
+
+
+def test_pinned_piece_only_moves_along_pin_ray() -> None:
+    board = Board("4k3/4r3/8/8/8/8/4R3/4K3 w - - 0 1")
+    checkers, pinned, pin_rays = compute_checkers_and_pins(board, 0)
+    assert checkers == 0
+    assert pinned == 1 << 12
+    moves = _moves_uci(board)
+    assert {"e2e3", "e2e7"}.issubset(moves)
+    assert "e2d2" not in moves
+
+
+def test_generated_moves_are_shared_instances() -> None:
+    board = Board("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1")
+    first = generate_legal_moves(board)
+    second = generate_legal_moves(board)
+    assert first == second
+    assert all(a is b for a, b in zip(first, second))
@@ -1,5 +1,5 @@
 from engine.board import Board
-from engine.perft import perft
+from engine.perft import perft, perft_divide, perft_divide_iter
 
 
 def test_perft_start_position_depth_1_2_3() -> None:
@@ -22,3 +22,22 @@ def test_perft_kiwipete_depth_2() -> None:
 def test_perft_kiwipete_depth_3() -> None:
     board = Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
     assert perft(board, 3) == 97862
+
+
+def test_perft_position_3_depth_4() -> None:
+    # Rank-pinned en passant captures and discovered checks.
+    board = Board("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1")
+    assert perft(board, 4) == 43238
+
+
+def test_perft_divide_iter_streams_sorted_counts() -> None:
+    board = Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    divide = list(perft_divide_iter(board, 2))
+    assert [uci for uci, _ in divide] == sorted(uci for uci, _ in divide)
+    assert sum(count for _, count in divide) == 2039
+    assert dict(divide) == perft_divide(board, 2)
+
+
+def test_perft_divide_iter_with_workers_matches_serial() -> None:
+    board = Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    assert list(perft_divide_iter(board, 2, workers=2)) == list(perft_divide_iter(board, 2))
@@ -1,31 +1,203 @@
+import json
+from time import time
+from typing import Callable
+
+import pytest
+
 from engine.board import Board
-from engine.instrumentation import SearchSnapshot
-from engine.search import SearchEngine
+from engine.instrumentation import SearchSnapshot, SnapshotDiffer
+from engine.movegen import generate_legal_moves
+from engine.search import SearchEngine, _pick_next_move, _search_root_move
 
 
-def test_search_returns_a_legal_move() -> None:
-    board = Board("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1")
-    engine = SearchEngine()
+def test_search_returns_a_legal_move(after_e4_board: Board, engine: SearchEngine) -> None:
+    engine.clear()
 
-    result = engine.search(board, max_depth=2, time_limit_ms=2000)
+    result = engine.search(after_e4_board, max_depth=2, time_limit_ms=2000)
 
     assert result.best_move is not None
     assert result.depth >= 1
     assert result.nodes > 0
 
 
-def test_search_emits_live_snapshots() -> None:
-    board = Board("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1")
-    engine = SearchEngine()
+def test_search_emits_live_snapshots(after_e4_board: Board, engine: SearchEngine) -> None:
+    engine.clear()
     snapshots: list[SearchSnapshot] = []
 
     def on_snapshot(snapshot: SearchSnapshot) -> None:
         snapshots.append(snapshot)
 
-    engine.search(board, max_depth=2, time_limit_ms=2000, on_snapshot=on_snapshot, snapshot_interval_ms=20)
+    engine.search(
+        after_e4_board, max_depth=2, time_limit_ms=2000, on_snapshot=on_snapshot, snapshot_interval_ms=20
+    )
 
     assert snapshots
     latest = snapshots[-1]
     assert latest.depth >= 1
     assert isinstance(latest.candidate_moves, dict)
     assert isinstance(latest.piece_values, dict)
+
+
+def test_snapshot_to_dict_is_shallow_and_complete(make_snapshot: Callable[..., SearchSnapshot]) -> None:
+    heatmap = {"e4": 2}
+    snapshot = make_snapshot(heatmap=heatmap)
+
+    payload = snapshot.to_dict()
+    assert list(payload) == [f for f in SearchSnapshot.__dataclass_fields__ if not f.startswith("_")]
+    assert payload["heatmap"] is heatmap
+
+
+def test_snapshot_differ_sends_full_state_then_key_deltas(
+    make_snapshot: Callable[..., SearchSnapshot],
+) -> None:
+    differ = SnapshotDiffer()
+    piece_values = {"e2": 100}
+
+    first = json.loads(differ.encode(make_snapshot(heatmap={"e4": 2, "d4": 1}, piece_values=piece_values)))
+    assert first["heatmap"] == {"e4": 2, "d4": 1}
+    assert "diff" not in first
+
+    second = json.loads(differ.encode(make_snapshot(heatmap={"e4": 3, "f5": 1}, piece_values=piece_values)))
+    assert "heatmap" not in second and "piece_values" not in second
+    assert second["diff"] == {"heatmap": {"changed": {"e4": 3, "f5": 1}, "removed": ["d4"]}}
+
+
+def test_move_picker_matches_stable_sort_order() -> None:
+    board = Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    moves = generate_legal_moves(board)
+    expected = sorted(moves, key=lambda move: move.order_key, reverse=True)
+
+    scores = [move.order_key for move in moves]
+    picked = [_pick_next_move(moves, scores, idx) for idx in range(len(moves))]
+
+    assert picked == expected
+
+
+def test_parallel_root_search_matches_serial_best_move() -> None:
+    fen = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+    serial = SearchEngine().search(Board(fen), max_depth=2, time_limit_ms=60_000)
+
+    engine = SearchEngine(workers=2)
+    try:
+        parallel = engine.search(Board(fen), max_depth=2, time_limit_ms=60_000)
+    finally:
+        engine.close()
+
+    assert parallel.best_move == serial.best_move
+    assert parallel.score == serial.score
+    assert parallel.pv == serial.pv
+
+
+def test_parallel_root_search_submits_first_move_alpha(monkeypatch: pytest.MonkeyPatch) -> None:
+    root_scores: list[int] = []
+    submitted: list[tuple[int, int, int]] = []
+    negamax = SearchEngine._negamax
+    submit = SearchEngine._submit_root_moves
+
+    def spy_negamax(self, board, depth, alpha, beta, ply):
+        score = negamax(self, board, depth, alpha, beta, ply)
+        if ply == 1:
+            root_scores.append(-score)
+        return score
+
+    def spy_submit(self, board, moves, depth, alpha, beta):
+        # With workers, the root searches only the first move in-process
+        # before submitting, so the last root score is that move's.
+        submitted.append((depth, alpha, root_scores[-1]))
+        assert beta == 100_000
+        return submit(self, board, moves, depth, alpha, beta)
+
+    monkeypatch.setattr(SearchEngine, "_negamax", spy_negamax)
+    monkeypatch.setattr(SearchEngine, "_submit_root_moves", spy_submit)
+
+    engine = SearchEngine(workers=2)
+    try:
+        engine.search(Board(), max_depth=3, time_limit_ms=60_000)
+    finally:
+        engine.close()
+
+    # Depth 1 is searched serially; each deeper iteration submits once.
+    assert [depth for depth, _, _ in submitted] == [2, 3]
+    assert all(alpha == first_score for _, alpha, first_score in submitted)
+
+
+def test_root_move_worker_honours_absolute_deadline() -> None:
+    fen = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+    move = generate_legal_moves(Board(fen))[0]
+
+    assert _search_root_move(fen, move, 8, -100_000, 100_000, time() - 1.0) is None
+    assert _search_root_move(fen, move, 2, -100_000, 100_000, time() + 60.0) is not None
+
+
+def test_transposition_table_persists_until_cleared() -> None:
+    board = Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    engine = SearchEngine()
+
+    first = engine.search(board, max_depth=3, time_limit_ms=60_000)
+    assert engine.tt
+    warm = engine.search(board, max_depth=3, time_limit_ms=60_000)
+    assert warm.score == first.score
+    assert warm.pv == first.pv
+    assert warm.nodes < first.nodes
+
+    engine.clear()
+    assert not engine.tt
+
+
+def test_transposition_table_respects_entry_cap() -> None:
+    board = Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    engine = SearchEngine(tt_max_entries=64)
+
+    engine.search(board, max_depth=3, time_limit_ms=60_000)
+
+    assert 0 < len(engine.tt) <= 64
+
+
+def test_transposition_table_overwrite_at_cap_keeps_entries() -> None:
+    board = Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    engine = SearchEngine(tt_max_entries=4)
+    # A full table that already holds this position at a shallower depth.
+    engine.tt = {key: (0, 0, 0, None) for key in (1, 2, 3)}
+    engine.tt[board.zobrist_hash] = (0, 0, 0, None)
+    engine._deadline = float("inf")
+
+    engine._negamax(board, 1, -100_000, 100_000, 0)
+
+    assert set(engine.tt) == {1, 2, 3, board.zobrist_hash}
+    assert engine.tt[board.zobrist_hash][0] == 1
+
+
+def test_quiescence_sees_recapture_past_the_horizon() -> None:
+    # Qxe5+ wins a pawn at depth 1 but loses the queen to dxe5.
+    board = Board("4k3/8/3p4/4p3/8/8/8/4QK2 w - - 0 1")
+    result = SearchEngine().search(board, max_depth=1, time_limit_ms=5_000)
+
+    assert result.best_move is not None
+    assert result.best_move.uci() != "e1e5"
+    assert result.score > 0
+
+
+def test_staged_moves_yield_every_legal_move_once() -> None:
+    board = Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    legal = generate_legal_moves(board)
+    tt_move = next(move for move in legal if move.uci() == "e2a6")
+    engine = SearchEngine()
+
+    staged = list(engine._staged_moves(board, tt_move, 0))
+
+    assert staged[0] is tt_move
+    assert len(staged) == len(legal)
+    assert set(staged) == set(legal)
+
+
+def test_staged_moves_skip_a_tt_move_that_is_not_legal_here() -> None:
+    board = Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    legal = generate_legal_moves(board)
+    # A hash collision could hand back a move from an unrelated position.
+    foreign = next(move for move in generate_legal_moves(Board()) if move.uci() == "e2e4")
+    assert foreign not in legal
+
+    staged = list(SearchEngine()._staged_moves(board, foreign, 0))
+
+    assert foreign not in staged
+    assert len(staged) == len(legal)